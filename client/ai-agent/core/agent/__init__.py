@@ -1,3 +1,3 @@
-from .runner import run_agent
+from .runner import get_agent, run_agent
 
-__all__ = ["run_agent"]
\ No newline at end of file
+__all__ = ["get_agent", "run_agent"]
\ No newline at end of file
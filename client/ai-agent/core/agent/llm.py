@@ -1,18 +1,70 @@
 # core/agent/llm.py
 
-from langchain_openai import ChatOpenAI
+import threading
+from typing import TYPE_CHECKING
+
+from langchain_core.globals import set_llm_cache
+from pydantic import SecretStr
 
 from core.config import get_settings
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 _model = None
+_model_lock = threading.Lock()
+# Shared by every async OpenAI request so connections are reused over HTTP/2
+_http_client = None
+
+
+def _setup_llm_cache(backend: str, path: str):
+    """Install the process-wide LangChain response cache for the given backend."""
+    if backend == "memory":
+        from langchain_core.caches import InMemoryCache
+        set_llm_cache(InMemoryCache())
+    elif backend == "sqlite":
+        try:
+            from langchain_community.cache import SQLiteCache
+        except ImportError as e:
+            raise ValueError(
+                "LLM_CACHE_BACKEND=sqlite requires the langchain-community package"
+            ) from e
+        set_llm_cache(SQLiteCache(database_path=path))
 
 
-def get_llm() -> ChatOpenAI:
-    global _model
-    llm_settings = get_settings()
+def get_llm() -> "ChatOpenAI":
+    global _model, _http_client
     if _model is None:
-        _model = ChatOpenAI(
-            api_key=llm_settings.OPENAI_API_KEY,
-            model=llm_settings.OPENAI_MODEL,
-        )
+        with _model_lock:
+            # re-check: another caller may have built it while we waited
+            if _model is None:
+                # imported here to keep it off the CLI's import-time path
+                import httpx
+                from langchain_openai import ChatOpenAI
+
+                llm_settings = get_settings()
+                _setup_llm_cache(llm_settings.LLM_CACHE_BACKEND, llm_settings.LLM_CACHE_PATH)
+                _http_client = httpx.AsyncClient(
+                    http2=True,
+                    timeout=60,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                )
+                # unwrap once here so the key is never handled as a SecretStr repr later
+                api_key = llm_settings.OPENAI_API_KEY
+                if isinstance(api_key, SecretStr):
+                    api_key = api_key.get_secret_value()
+                _model = ChatOpenAI(
+                    api_key=api_key,
+                    model=llm_settings.OPENAI_MODEL,
+                    http_async_client=_http_client,
+                )
     return _model
+
+
+async def close_llm():
+    """Closes the shared HTTP client and drops the cached model."""
+    global _model, _http_client
+    with _model_lock:
+        client, _http_client, _model = _http_client, None, None
+    if client is not None:
+        await client.aclose()
@@ -1,6 +1,7 @@
 # core/agent/runner.py
 
-from typing import Optional
+import logging
+from typing import Any, Optional
 
 from langgraph.prebuilt import create_react_agent
 from langchain_core.messages import HumanMessage
@@ -8,24 +9,41 @@ from langchain_core.messages import HumanMessage
 from core.agent.llm import get_llm
 from core.agent.tools import get_mcp_tools
 
-import os
-os.environ["LANGCHAIN_DEBUG"] = "true"
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
+# The compiled agent graph, memoized like the model in get_llm()
+_agent: Any = None
+_agent_key: Optional[tuple] = None
 
-async def run_agent(prompt: str, session_id: Optional[str] = None, user_id: Optional[str] = None) -> str:
+
+async def get_agent() -> Any:
+    """
+    Returns the compiled ReAct agent, building it on first use.
+
+    The graph is rebuilt only when the model or the discovered tool list changes
+    (e.g. after the MCP servers were reconnected).
+    """
+    global _agent, _agent_key
     model = get_llm()
     tools = await get_mcp_tools()
 
-    agent = create_react_agent(model, tools)
+    key = (id(model), id(tools), tuple(sorted(tool.name for tool in tools)))
+    if _agent is None or _agent_key != key:
+        _agent = create_react_agent(model, tools)
+        _agent_key = key
+    return _agent
+
+
+async def run_agent(prompt: str, session_id: Optional[str] = None, user_id: Optional[str] = None) -> str:
+    agent = await get_agent()
     
     state = {"messages": [HumanMessage(content=prompt.strip())]}
 
-    # --- temporary debug: prove we’re not empty going in ---
-    print("DEBUG: invoking agent with", state)
+    logger.debug("invoking agent with %s", state)
     
     response = await agent.ainvoke(state)
     
-    # return response.get("messages", "No response from agent.")
-    # ✅ pull the last AI message from the graph state
+    # pull the last AI message from the graph state
     messages = response.get("messages", [])
     return messages[-1].content if messages else "No response from agent."
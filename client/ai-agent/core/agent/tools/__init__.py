@@ -1,4 +1,4 @@
 # core/agent/tools/__init__.py
-from .mcp_tools import get_mcp_tools
+from .mcp_tools import get_mcp_tools, get_mcp_client, close_mcp_client
 
-__all__ = ["get_mcp_tools"]
\ No newline at end of file
+__all__ = ["get_mcp_tools", "get_mcp_client", "close_mcp_client"]
@@ -1,15 +1,25 @@
 # core/agent/tools/mcp_tools.py
 
-from langchain_mcp_adapters.client import MultiServerMCPClient
+import asyncio
+import hashlib
+import json
 from pathlib import Path
+from typing import Optional
+
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
+from mcp import ClientSession
+
 
+# Resolved once at import so every server spawn gets a CWD-independent path
+_SERVERS_DIR = Path(__file__).resolve().parents[5] / "servers"
 
 mcp_config = {
         "web_search": {
             "command": "uv",
             "args": [
                 "--directory",
-                str(Path(__file__).parent / "../../../../../servers/web_search/"),
+                str(_SERVERS_DIR / "web_search"),
                 "run",
                 "python",
                 "run_server.py"
@@ -20,7 +30,7 @@ mcp_config = {
             "command": "uv",
             "args": [
                 "--directory",
-                str(Path(__file__).parent / "../../../../../servers/page_analyzer/"),
+                str(_SERVERS_DIR / "page_analyzer"),
                 "run",
                 "python",
                 "run_server.py"
@@ -29,8 +39,128 @@ mcp_config = {
         }
     } # TODO: Define the MCP configuration here / or fetch from settings
 
+# Long-running tools should not block a single MCP call until the client
+# times out. Servers expose them as a start/poll pair instead, e.g. the
+# page_analyzer's `start_analysis(url) -> job_id` and
+# `poll_analysis(job_id) -> pending | completed + result`. The pair is
+# discovered like any other tool, so the agent needs no extra wiring here.
+
+
+class MCPServerPool:
+    """
+    Keeps one MCP session per server alive for the lifetime of the process.
+
+    Calls to the same server are serialized by a per-server lock, while calls
+    to different servers can run concurrently.
+    """
+
+    def __init__(self, connections: dict):
+        self.client = MultiServerMCPClient(connections)
+        self._server_locks = {name: asyncio.Lock() for name in connections}
+        self._sessions: dict[str, ClientSession] = {}
+        self._holders: dict[str, asyncio.Task] = {}
+        self._stop = asyncio.Event()
+
+    def lock(self, server_name: str) -> asyncio.Lock:
+        """Returns the lock serializing calls to the given server."""
+        return self._server_locks[server_name]
+
+    async def get_session(self, server_name: str) -> ClientSession:
+        """Returns the live session for a server, starting it on first use."""
+        async with self._server_locks[server_name]:
+            if server_name not in self._sessions:
+                ready = asyncio.get_running_loop().create_future()
+                self._holders[server_name] = asyncio.create_task(
+                    self._hold_session(server_name, ready)
+                )
+                self._sessions[server_name] = await ready
+            return self._sessions[server_name]
+
+    async def _hold_session(self, server_name: str, ready: asyncio.Future):
+        # The stdio transport must be entered and exited from the same task,
+        # so each session lives in its own task until the pool is closed.
+        try:
+            async with self.client.session(server_name) as session:
+                ready.set_result(session)
+                await self._stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                raise
+
+    async def get_tools(self, server_name: str) -> list:
+        """Loads the tools of a server, bound to its persistent session."""
+        session = await self.get_session(server_name)
+        tools = await load_mcp_tools(session)
+        lock = self._server_locks[server_name]
+        for tool in tools:
+            tool.coroutine = _serialized(tool.coroutine, lock)
+        return tools
+
+    async def close(self):
+        """Closes every open session."""
+        self._stop.set()
+        await asyncio.gather(*self._holders.values(), return_exceptions=True)
+        self._holders.clear()
+        self._sessions.clear()
+
+
+def _serialized(coroutine, lock: asyncio.Lock):
+    async def call(*args, **kwargs):
+        async with lock:
+            return await coroutine(*args, **kwargs)
+    return call
+
+
+_pool: Optional[MCPServerPool] = None
+
+# Discovered tools are semi-static, so keep them for the process lifetime and
+# only rediscover when the MCP configuration changes.
+_tools_cache: Optional[list] = None
+_config_hash: Optional[str] = None
+
+
+def _hash_config(config: dict) -> str:
+    return hashlib.sha1(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def get_mcp_client() -> MCPServerPool:
+    """Returns the process-wide MCP server pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = MCPServerPool(mcp_config)
+    return _pool
+
 
 async def get_mcp_tools():
-    mcp_client = MultiServerMCPClient(mcp_config)
-    tools = await mcp_client.get_tools()
+    global _pool, _tools_cache, _config_hash
+    config_hash = _hash_config(mcp_config)
+    if _tools_cache is not None and _config_hash == config_hash:
+        return _tools_cache
+
+    if _pool is not None and _config_hash != config_hash:
+        # the configuration changed, so the running sessions are stale
+        await _pool.close()
+        _pool = None
+
+    pool = get_mcp_client()
+    # discover all servers concurrently so startup costs max(server), not sum
+    results = await asyncio.gather(
+        *(pool.get_tools(server_name) for server_name in mcp_config)
+    )
+    tools = [tool for server_tools in results for tool in server_tools]
+
+    _tools_cache = tools
+    _config_hash = config_hash
     return tools
+
+
+async def close_mcp_client():
+    """Closes the MCP server pool and forgets the discovered tools."""
+    global _pool, _tools_cache, _config_hash
+    if _pool is not None:
+        await _pool.close()
+    _pool = None
+    _tools_cache = None
+    _config_hash = None
@@ -2,9 +2,9 @@
 import base64
 import json
 import os
-from typing import Any, Tuple, Callable
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError, NoRegionError
+import threading
+import time
+from typing import Any, Optional, Tuple, Callable
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .models import CombinedCoreSettings
@@ -12,23 +12,124 @@ from .models import CombinedCoreSettings
 
 SettingsSourceCallable = Callable[[BaseSettings], dict[str, Any]]
 
+# How long a retrieved secret is reused before Secrets Manager is asked again
+SECRET_REFRESH_INTERVAL = 3600.0
+
+# (region_name, tuple of secret names) -> (retrieved_at, parsed secret)
+_secret_cache: dict[tuple[str, tuple[str, ...]], tuple[float, dict]] = {}
+_secret_cache_lock = threading.Lock()
+
+
+# (access_key_id, region_name) -> Secrets Manager client with a pooled connection
+_CLIENT_CACHE: dict[tuple[str, str], Any] = {}
+_client_cache_lock = threading.Lock()
+
+
+def _sm_client(region_name: str):
+    """Returns a shared Secrets Manager client for the credentials and region."""
+    key = (os.getenv("AWS_ACCESS_KEY_ID", "default"), region_name)
+    with _client_cache_lock:
+        client = _CLIENT_CACHE.get(key)
+        if client is not None:
+            return client
+
+        # boto3 is imported lazily: only AWS-backed settings need it
+        import boto3
+        from botocore.config import Config
+
+        client = boto3.client(
+            "secretsmanager",
+            region_name=region_name,
+            config=Config(
+                max_pool_connections=10,
+                retries={"max_attempts": 3, "mode": "adaptive"},
+            ),
+        )
+        max_size = max(int(os.getenv("APP_AWS_CLIENT_CACHE_SIZE", "8")), 1)
+        while len(_CLIENT_CACHE) >= max_size:
+            # evict the oldest client
+            del _CLIENT_CACHE[next(iter(_CLIENT_CACHE))]
+        _CLIENT_CACHE[key] = client
+        return client
+
 
 class SecretsManagerSource:
     """
-    A custom settings source for Pydantic that retrieves settings from AWS Secrets Manager
+    A custom settings source for Pydantic that retrieves settings from AWS Secrets Manager.
+    Several secrets can be given; they are fetched in a single batch call and merged
+    in order, so later secrets override earlier ones.
     """
 
-    def __init__(self, secret_name: str, region_name: str = "ap-northeast-1"):
-        self.secret_name = secret_name
+    def __init__(
+        self,
+        secret_name: Optional[str] = None,
+        region_name: str = "ap-northeast-1",
+        secret_names: Optional[list[str]] = None,
+    ):
+        self.secret_names = list(secret_names) if secret_names else [secret_name]
+        self.secret_name = ", ".join(str(name) for name in self.secret_names)
         self.region_name = region_name
-        self.client = boto3.client("secretsmanager", region_name=region_name)
+        self.client = _sm_client(region_name)
 
     def __call__(self, settings: BaseSettings) -> dict:
+        key = (self.region_name, tuple(self.secret_names))
+        with _secret_cache_lock:
+            cached = _secret_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < SECRET_REFRESH_INTERVAL:
+                return dict(cached[1])
+
+        if len(self.secret_names) == 1:
+            secret = self._fetch_secret()
+        else:
+            secret = self._fetch_secrets_batch()
+        with _secret_cache_lock:
+            _secret_cache[key] = (time.monotonic(), secret)
+        return dict(secret)
+
+    def _fetch_secret(self) -> dict:
+        """Retrieves and parses the secret from AWS Secrets Manager."""
+        from botocore.exceptions import ClientError, NoCredentialsError, NoRegionError
+
         try:
-            response = self.client.get_secret_value(SecretId=self.secret_name)
+            response = self.client.get_secret_value(SecretId=self.secret_names[0])
         except (ClientError, NoCredentialsError, NoRegionError) as e:
             raise ValueError(f"Failed to retrieve secret {self.secret_name}: {e}")
 
+        return self._parse_secret(self.secret_name, response)
+
+    def _fetch_secrets_batch(self) -> dict:
+        """Retrieves all secrets with batch_get_secret_value and merges them."""
+        from botocore.exceptions import ClientError, NoCredentialsError, NoRegionError
+
+        values: dict[str, dict] = {}
+        kwargs: dict[str, Any] = {"SecretIdList": self.secret_names}
+        try:
+            while True:
+                response = self.client.batch_get_secret_value(**kwargs)
+                for error in response.get("Errors", []):
+                    raise ValueError(
+                        f"Failed to retrieve secret {error.get('SecretId')}: "
+                        f"{error.get('ErrorCode')} {error.get('Message', '')}".rstrip()
+                    )
+                for entry in response.get("SecretValues", []):
+                    values[entry.get("Name")] = entry
+                    values[entry.get("ARN")] = entry
+                if not response.get("NextToken"):
+                    break
+                kwargs["NextToken"] = response["NextToken"]
+        except (ClientError, NoCredentialsError, NoRegionError) as e:
+            raise ValueError(f"Failed to retrieve secrets {self.secret_name}: {e}")
+
+        merged: dict = {}
+        for name in self.secret_names:
+            if name not in values:
+                raise ValueError(f"Secret {name} not found or empty.")
+            merged.update(self._parse_secret(name, values[name]))
+        return merged
+
+    @staticmethod
+    def _parse_secret(secret_name: str, response: dict) -> dict:
+        """Decodes the JSON payload of a secret value response."""
         secret: bytes | str | None = response.get("SecretString")
         # If SecretString is None, try SecretBinary
         if secret is None and (b64 := response.get("SecretBinary")) is not None:
@@ -36,11 +137,11 @@ class SecretsManagerSource:
                 secret = base64.b64decode(b64)
             except Exception as e:
                 raise ValueError(
-                    f"Failed to decode base64 from secret {self.secret_name}: {e}"
+                    f"Failed to decode base64 from secret {secret_name}: {e}"
                 )
 
         if secret is None:
-            raise ValueError(f"Secret {self.secret_name} not found or empty.")
+            raise ValueError(f"Secret {secret_name} not found or empty.")
 
         try:
             if isinstance(secret, (bytes, bytearray)):
@@ -48,7 +149,7 @@ class SecretsManagerSource:
             return json.loads(secret)
         except (UnicodeDecodeError, json.JSONDecodeError) as e:
             raise ValueError(
-                f"Failed to parse JSON from secret {self.secret_name}: {e}"
+                f"Failed to parse JSON from secret {secret_name}: {e}"
             )
 
 
@@ -67,6 +168,8 @@ class AWSAppSettings(CombinedCoreSettings):
     AWS application settings, loaded from AWS Secrets Manager.
     AWS settings prioritized from AWS Secrets Manager, then init/env/.env.
     `APP_SECRET_NAME` and `AWS_REGION` (or `AWS_DEFAULT_REGION`) can control the secret lookup.
+    `APP_SECRET_NAME` may list several comma-separated secrets, fetched in one batch call.
+    `APP_AWS_CLIENT_CACHE_SIZE` caps how many Secrets Manager clients are kept (default 8).
     """
 
     @classmethod
@@ -80,7 +183,11 @@ class AWSAppSettings(CombinedCoreSettings):
     ) -> Tuple[SettingsSourceCallable, ...]:
         """Prioritize AWS Secrets Manager settings"""
         # Read env directly to avoid instantiating settings inside the hook
-        secret_name = os.getenv("APP_SECRET_NAME")
+        secret_names = [
+            name.strip()
+            for name in os.getenv("APP_SECRET_NAME", "").split(",")
+            if name.strip()
+        ]
         region = (
             os.getenv("AWS_REGION")
             or os.getenv("AWS_DEFAULT_REGION")
@@ -89,7 +196,7 @@ class AWSAppSettings(CombinedCoreSettings):
 
         return (
             SecretsManagerSource(
-                secret_name=secret_name,
+                secret_names=secret_names,
                 region_name=region,
             ),
             init_settings,
@@ -1,4 +1,6 @@
 # core/config/models.py
+from typing import Literal
+
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings
 
@@ -6,6 +8,9 @@ class LLMSettings(BaseSettings):
     """Settings for the LLM (Large Language Model) configuration."""
     OPENAI_API_KEY: SecretStr
     OPENAI_MODEL: str
+    # "memory" suits the single-process CLI, "sqlite" persists across runs
+    LLM_CACHE_BACKEND: Literal["none", "memory", "sqlite"] = "none"
+    LLM_CACHE_PATH: str = ".langchain.db"
 
 class MCPSettings(BaseSettings):
     """Settings for the MCP (Model Context Protocol) configuration."""
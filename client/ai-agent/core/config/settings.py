@@ -1,10 +1,20 @@
 # core/config/settings.py
+import functools
+import threading
 from typing import Optional, Type
 
 from .loaders import LocalAppSettings
 from .models import CombinedCoreSettings
 
-_settings: Optional[CombinedCoreSettings] = None
+_settings_class: Optional[Type[CombinedCoreSettings]] = None
+# Serializes initialization so concurrent callers load settings exactly once
+_init_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve() -> CombinedCoreSettings:
+    """Builds the settings object once; every later call is a cache hit."""
+    return _settings_class()
 
 
 def initialize_settings(settings_class: Type[CombinedCoreSettings] = LocalAppSettings):
@@ -16,11 +26,18 @@ def initialize_settings(settings_class: Type[CombinedCoreSettings] = LocalAppSet
     Args:
         settings_class (Type[CombinedCoreSettings], optional): The settings class to use. Defaults to LocalAppSettings.
     """
-    global _settings
-    if _settings is not None:
-        # avoid re-initializing settings
-        return
-    _settings = settings_class()
+    global _settings_class
+    with _init_lock:
+        if _settings_class is not None:
+            # avoid re-initializing settings
+            return
+        _settings_class = settings_class
+        # load eagerly so configuration errors surface at startup
+        try:
+            _resolve()
+        except Exception:
+            _settings_class = None
+            raise
 
 
 def get_settings() -> CombinedCoreSettings:
@@ -32,8 +49,8 @@ def get_settings() -> CombinedCoreSettings:
     Returns:
         CombinedCoreSettings: The initialized settings object.
     """
-    if _settings is None:
+    if _settings_class is None:
         raise ValueError(
             "Settings have not been initialized. Call initialize_settings() at the beginning of your application."
         )
-    return _settings
+    return _resolve()
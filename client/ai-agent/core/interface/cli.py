@@ -1,28 +1,82 @@
 # core/interface/cli.py
 import asyncio
+import threading
 
-from core.agent import run_agent
+from core.agent import get_agent, run_agent
+from core.agent.llm import close_llm
+from core.agent.tools import close_mcp_client
 from core.config import LocalAppSettings, initialize_settings
 
+
+async def _warmup():
+    """Build the LLM client, MCP tools and agent graph ahead of the first prompt."""
+    await get_agent()
+
+
+async def _ainput(prompt: str) -> str:
+    """
+    Read a line on a daemon thread so the event loop keeps running meanwhile.
+
+    A daemon thread (rather than asyncio.to_thread) keeps interpreter shutdown
+    from waiting on a pending input() call after Ctrl+C.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(result, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def read():
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(resolve, None, e)
+        else:
+            loop.call_soon_threadsafe(resolve, line, None)
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
 async def main():
     print("MCP ReAct Agent CLI")
     # initialize settings from LocalAppSettings
     # This will load settings from the local .env file and environment variables
     initialize_settings(LocalAppSettings)
-    while True:
-        try:
-            prompt = input("Enter your prompt (or 'exit' to quit): ")
-            if prompt.lower() == 'exit':
-                print("Exiting the CLI.")
+    # warm up in the background while the user types the first prompt
+    warmup = asyncio.create_task(_warmup())
+    try:
+        while True:
+            try:
+                prompt = await _ainput("Enter your prompt (or 'exit' to quit): ")
+                if prompt.lower() == 'exit':
+                    print("Exiting the CLI.")
+                    break
+
+                if warmup is not None:
+                    # a failed warm-up is retried (and reported) by run_agent
+                    await asyncio.gather(warmup, return_exceptions=True)
+                    warmup = None
+
+                response = await run_agent(prompt)
+                print(f"Agent Response: {response}")
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                # Ctrl+C reaches us as a cancellation from asyncio.run while
+                # input() runs on its own thread
+                print("\nExiting the CLI.")
                 break
-            
-            response = await run_agent(prompt)
-            print(f"Agent Response: {response}")
-        except KeyboardInterrupt:
-            print("\nExiting the CLI.")
-            break
-        except Exception as e:
-            print(f"Error: {e}")
+            except Exception as e:
+                print(f"Error: {e}")
+    finally:
+        if warmup is not None:
+            warmup.cancel()
+        await close_mcp_client()
+        await close_llm()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,11 +1,18 @@
 """Analysis manager for coordinating different content analyzers."""
 
 import asyncio
+import functools
+import multiprocessing
+import os
+import re
 import time
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional, Dict, Any
 from urllib.parse import urlparse
 
+import httpx
+
 from .analysis_types import (
     PageAnalysis,
     PageMetadata,
@@ -22,6 +29,56 @@ from .analyzers.feed_analyzer import FeedAnalyzer
 from .analyzers.api_analyzer import ApiAnalyzer
 
 
+# Longest error message kept per failed URL in batch responses
+_MAX_ERROR_LENGTH = 256
+
+# Hosts whose sniffed content type is remembered
+_SNIFF_CACHE_SIZE = 1024
+
+# URL path patterns used to guess the content type when no hint is given
+_FEED_RE = re.compile(r'/feed|/rss|/atom|\.rss|\.xml|\.atom')
+_API_RE = re.compile(r'/api/|/v[12]/|/json|\.json')
+
+
+@functools.lru_cache(maxsize=4096)
+def _content_type_from_url(url: str) -> ContentType:
+    """Guess the content type from URL path patterns (cached per URL)."""
+    path = urlparse(url.lower()).path
+    
+    # Check for feed patterns
+    if _FEED_RE.search(path):
+        return ContentType.ATOM if 'atom' in path else ContentType.RSS
+    
+    # Check for API patterns
+    if _API_RE.search(path):
+        return ContentType.API
+    
+    # Default to HTML
+    return ContentType.HTML
+
+
+def _install_uvloop() -> bool:
+    """
+    Use uvloop's event loop policy if it is installed and no loop is running yet.
+    
+    The policy only affects loops created afterwards, so it must be installed
+    before the first asyncio.run(...) (e.g. before mcp.run()).
+    """
+    try:
+        asyncio.get_running_loop()
+        return False  # too late to swap the loop
+    except RuntimeError:
+        pass
+    
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 class AnalysisManager:
     """Manager for coordinating different content analyzers."""
     
@@ -29,23 +86,30 @@ class AnalysisManager:
         """Initialize analysis manager with configuration."""
         self.config = config or AnalysisConfig()
         
+        if self.config.use_uvloop:
+            _install_uvloop()
+        
         # Initialize analyzers
         self.html_analyzer = HtmlAnalyzer(self.config)
         self.feed_analyzer = FeedAnalyzer(self.config)
         self.api_analyzer = ApiAnalyzer(self.config)
         
-        # Throttling for batch operations
-        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Worker processes for batch HTML parsing, created on first use and only
+        # with parse_in_processes; otherwise pages parse on worker threads
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        
+        # (scheme, host) -> content type sniffed from a HEAD response
+        self._sniffed_types: "OrderedDict[tuple, ContentType]" = OrderedDict()
     
     async def analyze_page(self, url: str, content_type: Optional[str] = None,
-                          options: Optional[Dict[str, Any]] = None) -> PageAnalysis:
+                          parse_in_pool: bool = False) -> PageAnalysis:
         """
         Analyze a single page or content source.
         
         Args:
             url: URL to analyze
             content_type: Hint for content type ("html", "rss", "api", "auto")
-            options: Additional analysis options
+            parse_in_pool: Parse HTML pages in the manager's process pool
             
         Returns:
             PageAnalysis object with extracted content and metadata
@@ -53,15 +117,12 @@ class AnalysisManager:
         start_time = time.time()
         
         try:
-            # Merge options with config if provided
-            if options:
-                config = self._merge_config_with_options(options)
-                # Update analyzers with new config if needed
-                if config != self.config:
-                    await self._update_analyzer_configs(config)
-            
             # Determine content type
             detected_type = self._detect_content_type(url, content_type)
+            if (detected_type == ContentType.HTML and self.config.sniff_content_type
+                    and (not content_type or content_type.lower() == "auto")):
+                # URL patterns were inconclusive; ask the server instead
+                detected_type = await self._sniff_content_type(url)
             
             # Route to appropriate analyzer
             if detected_type == ContentType.RSS or detected_type == ContentType.ATOM:
@@ -70,66 +131,68 @@ class AnalysisManager:
                 return await self.api_analyzer.analyze_api_as_page(url)
             else:
                 # Default to HTML analysis
-                return await self.html_analyzer.analyze(url)
+                parse_executor = self._get_parse_pool() if parse_in_pool else None
+                return await self.html_analyzer.analyze(url, parse_executor)
                 
         except Exception as e:
             processing_time = time.time() - start_time
-            return PageAnalysis(
+            # Trusted internal values, so skip validation
+            return PageAnalysis.model_construct(
                 url=url,
                 content_type=ContentType.UNKNOWN,
                 status=AnalysisStatus.ERROR,
                 error_message=str(e),
-                analyzed_at=datetime.now(),
+                analyzed_at=start_time,
                 processing_time=processing_time
             )
     
-    async def analyze_batch(self, urls: List[str], max_concurrent: int = 5,
-                           options: Optional[Dict[str, Any]] = None) -> BatchAnalysisResponse:
+    async def analyze_batch(self, urls: List[str], max_concurrent: int = 5) -> BatchAnalysisResponse:
         """
         Analyze multiple URLs concurrently with throttling.
         
         Args:
             urls: List of URLs to analyze
             max_concurrent: Maximum concurrent analyses
-            options: Additional analysis options
             
         Returns:
             BatchAnalysisResponse with results and statistics
         """
         start_time = time.time()
         
-        # Setup semaphore for concurrency control
-        self._semaphore = asyncio.Semaphore(max_concurrent)
-        
-        # Create analysis tasks
-        tasks = [
-            self._analyze_with_semaphore(url, options)
-            for url in urls
-        ]
+        # Semaphore is local to the call so concurrent batches don't share a limit
+        semaphore = asyncio.Semaphore(max_concurrent)
         
-        # Execute tasks
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def analyze(index: int, url: str):
+            try:
+                return index, await self._analyze_with_semaphore(url, semaphore)
+            except Exception as e:
+                return index, e
         
-        # Process results
-        successful_analyses = []
+        # Process results as they complete so failed analyses can be released early;
+        # successes land in a presized slot list that keeps request order
+        successful_slots: List[Optional[PageAnalysis]] = [None] * len(urls)
         failed_analyses = []
         errors = []
         
-        for i, result in enumerate(results):
+        for next_result in asyncio.as_completed([analyze(i, url) for i, url in enumerate(urls)]):
+            i, result = await next_result
+            # Anything that is not an exception is the analysis itself
             if isinstance(result, Exception):
                 failed_analyses.append(urls[i])
-                errors.append(f"{urls[i]}: {str(result)}")
-            elif isinstance(result, PageAnalysis):
-                if result.status == AnalysisStatus.SUCCESS:
-                    successful_analyses.append(result)
-                else:
-                    failed_analyses.append(result.url)
-                    if result.error_message:
-                        errors.append(f"{result.url}: {result.error_message}")
+                errors.append((urls[i], f"{type(result).__name__}: {str(result)[:_MAX_ERROR_LENGTH]}"))
+            elif result.status == AnalysisStatus.SUCCESS:
+                successful_slots[i] = result
+            else:
+                failed_analyses.append(result.url)
+                if result.error_message:
+                    errors.append((result.url, result.error_message[:_MAX_ERROR_LENGTH]))
+        
+        successful_analyses = [result for result in successful_slots if result is not None]
         
         total_processing_time = time.time() - start_time
         
-        return BatchAnalysisResponse(
+        # Results were validated when the analyzers built them
+        return BatchAnalysisResponse.model_construct(
             total_requested=len(urls),
             successful_analyses=len(successful_analyses),
             failed_analyses=len(failed_analyses),
@@ -166,73 +229,49 @@ class AnalysisManager:
         """
         return await self.api_analyzer.analyze_api_response(url, response_data, schema_hint)
     
+    async def analyze_api_responses(self, urls: List[str], max_concurrent: int = 16,
+                                    schema_hint: Optional[str] = None) -> List[ApiAnalysis]:
+        """
+        Fetch and analyze several API endpoints concurrently.
+        
+        Args:
+            urls: API endpoint URLs
+            max_concurrent: Maximum number of requests in flight
+            schema_hint: Expected data structure type (optional)
+            
+        Returns:
+            ApiAnalysis objects in the same order as the URLs
+        """
+        return await self.api_analyzer.analyze_many(urls, max_concurrent, schema_hint)
+    
     async def get_page_metadata(self, url: str, quick_mode: bool = True) -> PageMetadata:
         """
         Extract basic page metadata without full content processing.
         
         Args:
             url: URL to analyze
-            quick_mode: Skip heavy content extraction
+            quick_mode: Use a shorter timeout and treat every URL as an HTML page
             
         Returns:
             PageMetadata object with basic page information
         """
-        start_time = time.time()
-        
         try:
-            # Create lightweight config for quick analysis
-            if quick_mode:
-                quick_config = AnalysisConfig(
-                    extract_main_content=False,
-                    extract_links=False,
-                    extract_images=False,
-                    discover_feeds=False,
-                    calculate_scores=False,
-                    timeout=10  # Shorter timeout for quick mode
+            content_type = self._detect_content_type(url)
+            
+            if quick_mode or content_type == ContentType.HTML:
+                # Metadata-only pass on the shared HTML analyzer: no main content,
+                # scores or link discovery that would be thrown away anyway
+                metadata = await self.html_analyzer.analyze_metadata_only(
+                    url,
+                    timeout=10 if quick_mode else None,  # Shorter timeout for quick mode
+                    content_type=content_type
                 )
-                
-                # Create temporary analyzer with quick config
-                html_analyzer = HtmlAnalyzer(quick_config)
-                
-                try:
-                    # Fetch and parse basic metadata only
-                    response = await html_analyzer._fetch_page(url)
-                    if not response:
-                        return self._metadata_error_result(url, "Failed to fetch page")
-                    
-                    from bs4 import BeautifulSoup
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # Extract basic metadata
-                    title = html_analyzer._extract_title(soup)
-                    description = html_analyzer._extract_description(soup)
-                    language = html_analyzer._detect_language(title or description or "")
-                    author = html_analyzer._extract_author(soup)
-                    published_date = html_analyzer._extract_published_date(soup)
-                    last_modified = html_analyzer._extract_last_modified(soup, response.headers)
-                    
-                    # Determine content type
-                    content_type = self._detect_content_type(url)
-                    
-                    return PageMetadata(
-                        url=url,
-                        title=title,
-                        description=description,
-                        language=language,
-                        author=author,
-                        published_date=published_date,
-                        last_modified=last_modified,
-                        content_type=content_type,
-                        status_code=response.status_code,
-                        response_time=response.elapsed.total_seconds(),
-                        content_length=len(response.content)
-                    )
-                    
-                finally:
-                    await html_analyzer.close()
+                if metadata is None:
+                    return self._metadata_error_result(url, "Failed to fetch page")
+                return metadata
             
             else:
-                # Full analysis but extract only metadata
+                # Feeds and APIs carry their metadata in the parsed content
                 analysis = await self.analyze_page(url)
                 
                 return PageMetadata(
@@ -253,10 +292,21 @@ class AnalysisManager:
         except Exception as e:
             return self._metadata_error_result(url, str(e))
     
-    async def _analyze_with_semaphore(self, url: str, options: Optional[Dict[str, Any]] = None) -> PageAnalysis:
+    async def _analyze_with_semaphore(self, url: str, semaphore: asyncio.Semaphore) -> PageAnalysis:
         """Analyze URL with semaphore-based concurrency control."""
-        async with self._semaphore:
-            return await self.analyze_page(url, options=options)
+        async with semaphore:
+            return await self.analyze_page(url, parse_in_pool=self.config.parse_in_processes)
+    
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """The process pool for HTML parsing, started on first use."""
+        if self._parse_pool is None:
+            # Spawned, not forked: by now the process has a running loop and
+            # worker threads that a forked child would inherit mid-flight
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._parse_pool
     
     def _detect_content_type(self, url: str, content_type_hint: Optional[str] = None) -> ContentType:
         """Detect content type from URL and hints."""
@@ -270,46 +320,40 @@ class AnalysisManager:
                 return ContentType.HTML
         
         # Analyze URL patterns
-        url_lower = url.lower()
-        parsed = urlparse(url_lower)
-        path = parsed.path
-        
-        # Check for feed patterns
-        feed_patterns = ['/feed', '/rss', '/atom', '.rss', '.xml', '.atom']
-        if any(pattern in path for pattern in feed_patterns):
-            if 'atom' in path:
-                return ContentType.ATOM
-            else:
-                return ContentType.RSS
-        
-        # Check for API patterns
-        api_patterns = ['/api/', '/v1/', '/v2/', '/json', '.json']
-        if any(pattern in path for pattern in api_patterns):
-            return ContentType.API
-        
-        # Default to HTML
-        return ContentType.HTML
+        return _content_type_from_url(url)
     
-    def _merge_config_with_options(self, options: Dict[str, Any]) -> AnalysisConfig:
-        """Merge analysis options with base configuration."""
-        config_dict = self.config.model_dump()
+    async def _sniff_content_type(self, url: str) -> ContentType:
+        """Detect content type from a HEAD response, cached per scheme and host."""
+        parsed = urlparse(url)
+        key = (parsed.scheme, parsed.netloc)
+        cached = self._sniffed_types.get(key)
+        if cached is not None:
+            self._sniffed_types.move_to_end(key)
+            return cached
         
-        # Update with provided options
-        for key, value in options.items():
-            if hasattr(self.config, key):
-                config_dict[key] = value
+        try:
+            response = await self.html_analyzer.client.head(url, follow_redirects=True)
+        except httpx.HTTPError:
+            return ContentType.HTML
         
-        return AnalysisConfig(**config_dict)
-    
-    async def _update_analyzer_configs(self, new_config: AnalysisConfig):
-        """Update analyzer configurations if needed."""
-        # For now, keep using existing analyzers
-        # In a production system, might want to recreate analyzers with new config
-        pass
+        header = response.headers.get("content-type", "").lower()
+        if "atom+xml" in header:
+            detected = ContentType.ATOM
+        elif "rss+xml" in header or "feed+json" in header:
+            detected = ContentType.RSS
+        elif "json" in header:
+            detected = ContentType.API
+        else:
+            detected = ContentType.HTML
+        
+        self._sniffed_types[key] = detected
+        if len(self._sniffed_types) > _SNIFF_CACHE_SIZE:
+            self._sniffed_types.popitem(last=False)
+        return detected
     
     def _metadata_error_result(self, url: str, error_msg: str) -> PageMetadata:
         """Create error result for metadata extraction."""
-        return PageMetadata(
+        return PageMetadata.model_construct(
             url=url,
             content_type=ContentType.UNKNOWN,
             error_message=error_msg
@@ -317,12 +361,16 @@ class AnalysisManager:
     
     async def close(self):
         """Close all analyzers and cleanup resources."""
-        await asyncio.gather(
-            self.html_analyzer.close(),
-            self.feed_analyzer.close(),
-            self.api_analyzer.close(),
-            return_exceptions=True
-        )
+        done, _ = await asyncio.wait({
+            asyncio.create_task(self.html_analyzer.close()),
+            asyncio.create_task(self.feed_analyzer.close()),
+            asyncio.create_task(self.api_analyzer.close()),
+        })
+        for task in done:
+            # retrieve (and drop) close errors so they are not reported as unhandled
+            task.exception()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -1,9 +1,10 @@
 """Type definitions for page analysis functionality."""
 
+import time
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any, Literal
-from pydantic import BaseModel, Field, HttpUrl
+from typing import List, Optional, Dict, Any, Literal, Tuple
+from pydantic import BaseModel, Field, HttpUrl, field_serializer, field_validator
 
 
 class ContentType(str, Enum):
@@ -83,8 +84,21 @@ class PageAnalysis(BaseModel):
     error_message: Optional[str] = None
     
     # Processing Metadata
-    analyzed_at: datetime = Field(default_factory=datetime.now)
+    analyzed_at: float = Field(default_factory=time.time)  # epoch seconds
     processing_time: float = 0.0
+    
+    @field_validator("analyzed_at", mode="before")
+    @classmethod
+    def _analyzed_at_from_datetime(cls, value: Any) -> Any:
+        """Accept datetimes for analyzed_at; they are stored as epoch seconds."""
+        if isinstance(value, datetime):
+            return value.timestamp()
+        return value
+    
+    @field_serializer("analyzed_at", when_used="json")
+    def _analyzed_at_to_datetime(self, value: float) -> str:
+        """Format analyzed_at as an ISO datetime only when serializing to JSON."""
+        return datetime.fromtimestamp(value).isoformat()
 
 
 class FeedInfo(BaseModel):
@@ -138,7 +152,12 @@ class BatchAnalysisResponse(BaseModel):
     failed_analyses: int
     results: List[PageAnalysis] = Field(default_factory=list)
     total_processing_time: float = 0.0
-    errors: List[str] = Field(default_factory=list)
+    errors: List[Tuple[str, str]] = Field(default_factory=list)  # (url, message)
+    
+    @field_serializer("errors", when_used="json")
+    def _errors_to_strings(self, value: List[Tuple[str, str]]) -> List[str]:
+        """Format (url, message) pairs as "url: message" only when serializing to JSON."""
+        return [f"{url}: {message}" for url, message in value]
 
 
 class AnalysisConfig(BaseModel):
@@ -162,6 +181,17 @@ class AnalysisConfig(BaseModel):
     # Language detection
     detect_language: bool = True
     
+    # Send a HEAD request to detect the content type when URL patterns are inconclusive
+    sniff_content_type: bool = False
+    
+    # Event loop (uvloop must be installed; applied before the loop starts)
+    use_uvloop: bool = False
+    
+    # Parse batch HTML pages in spawned worker processes instead of threads
+    parse_in_processes: bool = False
+    
     # Feed discovery settings  
     feed_discovery_depth: int = Field(default=2, ge=1, le=5)
+    feed_discovery_stop_after: int = Field(default=3, ge=1, le=10)  # Stop validating once this many feeds are found
+    max_feed_length: int = Field(default=5_000_000, ge=10_000)  # 5MB default; feeds often outgrow max_content_length
     validate_feeds: bool = True
\ No newline at end of file
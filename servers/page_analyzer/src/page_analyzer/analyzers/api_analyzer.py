@@ -1,13 +1,21 @@
 """API response analyzer for structured data sources."""
 
+import functools
 import json
+import re
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
-import httpx
-from bs4 import BeautifulSoup
+from dateutil import parser as date_parser
+from lxml import etree
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing when installed
+    orjson = None
 
 from ..analysis_types import (
     ApiAnalysis,
@@ -16,19 +24,184 @@ from ..analysis_types import (
     AnalysisStatus,
     AnalysisConfig
 )
+from .http_client import PooledClient, acquire_client, analyze_concurrently, release_client
+
+# Both parsers accept the raw response bytes, which skips decoding to str first
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Reused for every XML response; the string is already decoded, so the parser
+# overrides any declared encoding. Safe here as parsing only happens on the event loop.
+_XML_PARSER = etree.XMLParser(recover=True, encoding='utf-8', resolve_entities=False)
+
+# Key sets that identify common API response shapes, checked in order
+_SCHEMA_PATTERNS = (
+    (frozenset({'items', 'total', 'page'}), "paginated_api"),
+    (frozenset({'data', 'meta'}), "jsonapi"),
+    (frozenset({'results'}), "search_results"),
+    (frozenset({'feed', 'entries'}), "feed_api"),
+)
+
+
+# Objects with more top-level keys than this are usually maps keyed by ids or
+# dates, whose key sets never repeat; they skip the shape caches below
+_MAX_CACHED_KEYS = 8
+
+
+def _match_schema(keys) -> str:
+    """Schema name for an object with these top-level keys (any set-like)."""
+    for pattern, schema in _SCHEMA_PATTERNS:
+        if pattern <= keys:
+            return schema
+    return "generic_object"
+
+
+_object_schema = functools.lru_cache(maxsize=1024)(_match_schema)
+
+
+# Normalized field -> (source fields in priority order, max length)
+_NORMALIZED_FIELDS = (
+    ('title', ('title', 'name', 'headline', 'subject', 'summary'), 200),
+    ('content', ('content', 'description', 'body', 'text', 'message'), 1000),
+    ('url', ('url', 'link', 'href', 'permalink'), None),
+    ('date', ('date', 'created_at', 'updated_at', 'published_at', 'timestamp'), None),
+    ('id', ('id', 'uuid', 'key', 'identifier'), None),
+)
+
+# Every source field above; only these keys affect an item's plan
+_SOURCE_FIELDS = frozenset(
+    source for _, sources, _ in _NORMALIZED_FIELDS for source in sources
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalization_plan(keys: frozenset) -> tuple:
+    """
+    Extraction plan for items with these source fields (cached per field set).
+    
+    Items of one API response nearly always share a shape, so the source
+    fields present for each normalized field are worked out once per shape.
+    Callers pass only the item's keys that are in _SOURCE_FIELDS, which keeps
+    the cache keys small however wide the items are.
+    """
+    plan = []
+    for field, sources, max_length in _NORMALIZED_FIELDS:
+        present = tuple(source for source in sources if source in keys)
+        if present:
+            plan.append((field, present, max_length))
+    return tuple(plan)
+
+
+@functools.lru_cache(maxsize=1024)
+def _object_structure(keys: tuple) -> str:
+    """Structure description for an object with at most 5 keys (cached per key tuple)."""
+    return f"object({', '.join(keys)})"
+
+
+# Parsed JSON only produces these exact types, so a set lookup on type(value)
+# stands in for isinstance checks in the per-key metadata loop
+_SIMPLE_TYPES = frozenset({str, int, float, bool})
+_COMPLEX_TYPES = frozenset({list, dict})
 
 
+def _iter_repr(value: Any):
+    """Yield the pieces of str(value) for parsed JSON, outermost first."""
+    if isinstance(value, dict):
+        yield '{'
+        for index, (key, item) in enumerate(value.items()):
+            if index:
+                yield ', '
+            yield repr(key)
+            yield ': '
+            yield from _iter_repr(item)
+        yield '}'
+    elif isinstance(value, list):
+        yield '['
+        for index, item in enumerate(value):
+            if index:
+                yield ', '
+            yield from _iter_repr(item)
+        yield ']'
+    else:
+        yield repr(value)
+
+
+_LEADING_SPACE_RE = re.compile(r'\s*')
+
+
+def _markup_kind(data: str) -> Optional[str]:
+    """
+    Return "xml" or "html" when the string opens with markup, else None.
+    
+    Only the leading whitespace is scanned; strip() would copy the whole string.
+    """
+    start = _LEADING_SPACE_RE.match(data).end()
+    if data.startswith('<?xml', start):
+        return "xml"
+    if data.startswith('<', start):
+        return "html"
+    return None
+
+
+def _truncate(value: Any, limit: Optional[int]) -> str:
+    """str(value)[:limit], skipping the str() call for values that already are strings."""
+    text = value if type(value) is str else str(value)
+    return text[:limit]
+
+
+def _truncated_str(value: Any, limit: int) -> str:
+    """Equivalent to str(value)[:limit], without serializing the unused remainder."""
+    pieces = []
+    length = 0
+    for piece in _iter_repr(value):
+        pieces.append(piece)
+        length += len(piece)
+        if length >= limit:
+            break
+    return ''.join(pieces)[:limit]
+
+
+def _parse_date(date_str: str) -> datetime:
+    """Parse an API date, trying the C-level ISO 8601 parser before dateutil."""
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return date_parser.parse(date_str)
+
+
+def _element_text(element, limit: int) -> str:
+    """Stripped text of an XML element (like get_text(strip=True)), cut at limit."""
+    pieces = []
+    length = 0
+    for text in element.itertext():
+        text = text.strip()
+        if text:
+            pieces.append(text)
+            length += len(text)
+            if length >= limit:
+                break
+    return ''.join(pieces)[:limit]
+
 class ApiAnalyzer:
     """Analyzer for structured API responses and data sources."""
     
+    # Common patterns for content extraction
+    _CONTENT_FIELDS = (
+        'items', 'data', 'results', 'entries', 'posts', 'articles',
+        'content', 'records', 'documents', 'objects'
+    )
+    _CONTENT_FIELDS_SET = frozenset(_CONTENT_FIELDS)
+    
+    # Top-level fields describing the API itself, in priority order
+    _API_TITLE_FIELDS = ('title', 'name', 'api_name', 'service_name')
+    _API_DESCRIPTION_FIELDS = ('description', 'summary', 'about')
+    
+    # Analyzers with the same client settings share one connection pool per loop
+    client = PooledClient()
+    
     def __init__(self, config: Optional[AnalysisConfig] = None):
         """Initialize API analyzer with configuration."""
         self.config = config or AnalysisConfig()
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(self.config.timeout),
-            follow_redirects=self.config.follow_redirects,
-            headers={"User-Agent": self.config.user_agent}
-        )
+        acquire_client(self.config)
     
     async def analyze_api_response(self, url: str, response_data: Optional[Union[dict, str]] = None,
                                  schema_hint: Optional[str] = None) -> ApiAnalysis:
@@ -48,9 +221,10 @@ class ApiAnalyzer:
         try:
             # Fetch data if not provided
             if response_data is None:
-                response_data = await self._fetch_api_data(url)
-                if response_data is None:
+                fetched = await self._fetch_api_data(url)
+                if fetched is None:
                     return self._api_error_result(url, "Failed to fetch API data", start_time)
+                response_data, _ = fetched
             
             # Determine response structure
             response_structure = self._analyze_structure(response_data)
@@ -88,6 +262,23 @@ class ApiAnalyzer:
                 error_message=str(e)
             )
     
+    async def analyze_many(self, urls: List[str], max_concurrent: int = 16,
+                           schema_hint: Optional[str] = None) -> List[ApiAnalysis]:
+        """
+        Analyze several API endpoints concurrently.
+        
+        Args:
+            urls: API endpoint URLs
+            max_concurrent: Maximum number of requests in flight
+            schema_hint: Expected data structure type (optional)
+            
+        Returns:
+            ApiAnalysis objects in the same order as the URLs
+        """
+        return await analyze_concurrently(
+            urls, functools.partial(self.analyze_api_response, schema_hint=schema_hint), max_concurrent
+        )
+    
     async def analyze_api_as_page(self, url: str, response_data: Optional[Union[dict, str]] = None) -> PageAnalysis:
         """
         Analyze API response as a page for integration with general page analysis.
@@ -102,6 +293,18 @@ class ApiAnalyzer:
         start_time = time.time()
         
         try:
+            # Fetch here rather than in analyze_api_response so the raw data and
+            # its byte length are available below
+            if response_data is None:
+                fetched = await self._fetch_api_data(url)
+                if fetched is None:
+                    return self._page_error_result(url, "Failed to fetch API data", start_time)
+                response_data, content_length = fetched
+            elif isinstance(response_data, str):
+                content_length = len(response_data.encode())
+            else:
+                content_length = 0  # byte size of pre-parsed data is unknown
+            
             # Get API analysis first
             api_analysis = await self.analyze_api_response(url, response_data)
             
@@ -137,26 +340,42 @@ class ApiAnalyzer:
                 freshness_score=freshness_score,
                 external_links=external_links,
                 response_time=0.0,  # Would need original response
-                content_length=len(str(response_data)) if response_data else 0,
-                analyzed_at=datetime.now(),
+                content_length=content_length,
+                analyzed_at=start_time,
                 processing_time=processing_time
             )
             
         except Exception as e:
             return self._page_error_result(url, str(e), start_time)
     
-    async def _fetch_api_data(self, url: str) -> Optional[Union[dict, str]]:
-        """Fetch data from API endpoint."""
+    async def _fetch_api_data(self, url: str) -> Optional[Tuple[Union[dict, list, str], int]]:
+        """
+        Fetch data from API endpoint, returning the parsed data and the body size in bytes.
+        
+        The body is streamed and abandoned once it exceeds max_content_length,
+        so an oversized response is never buffered whole or parsed.
+        """
         try:
-            response = await self.client.get(url)
-            response.raise_for_status()
+            async with self.client.stream("GET", url) as response:
+                response.raise_for_status()
+                
+                max_length = self.config.max_content_length
+                declared = response.headers.get("content-length")
+                if declared and declared.isdigit() and int(declared) > max_length:
+                    return None
+                
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body.extend(chunk)
+                    if len(body) > max_length:
+                        return None
             
             # Try to parse as JSON first
             try:
-                return response.json()
-            except:
-                # Fall back to text
-                return response.text
+                return _json_loads(body), len(body)
+            except ValueError:
+                # Fall back to text (decode errors are ValueErrors too)
+                return body.decode(response.encoding or "utf-8", errors="replace"), len(body)
                 
         except Exception:
             return None
@@ -164,11 +383,9 @@ class ApiAnalyzer:
     def _analyze_structure(self, data: Union[dict, str, list]) -> str:
         """Analyze the structure of the response data."""
         if isinstance(data, dict):
-            keys = list(data.keys())
-            if len(keys) <= 5:
-                return f"object({', '.join(keys)})"
-            else:
-                return f"object({len(keys)} keys)"
+            if len(data) > 5:
+                return f"object({len(data)} keys)"
+            return _object_structure(tuple(data))
         elif isinstance(data, list):
             if len(data) == 0:
                 return "empty_array"
@@ -177,7 +394,7 @@ class ApiAnalyzer:
             else:
                 return f"array({len(data)} items, {type(data[0]).__name__})"
         elif isinstance(data, str):
-            if data.strip().startswith('<'):
+            if _markup_kind(data):
                 return "xml/html"
             else:
                 return f"string({len(data)} chars)"
@@ -190,58 +407,52 @@ class ApiAnalyzer:
         
         try:
             if isinstance(data, dict):
-                extracted.extend(self._extract_from_dict(data))
+                items = self._extract_from_dict(data)
             elif isinstance(data, list):
-                extracted.extend(self._extract_from_list(data))
+                items = self._extract_from_list(data)
             elif isinstance(data, str):
-                extracted.extend(self._extract_from_string(data))
+                items = self._extract_from_string(data)
+            else:
+                items = ()
+            
+            # The extractors are lazy, so nothing past the limit is normalized
+            extracted = list(islice(items, 100))  # Limit to 100 items
             
         except Exception:
             pass
         
-        return extracted[:100]  # Limit to 100 items
+        return extracted
     
-    def _extract_from_dict(self, data: dict) -> List[Dict[str, Any]]:
+    def _extract_from_dict(self, data: dict) -> Iterator[Dict[str, Any]]:
         """Extract content from dictionary response."""
-        content = []
-        
-        # Common patterns for content extraction
-        content_fields = [
-            'items', 'data', 'results', 'entries', 'posts', 'articles',
-            'content', 'records', 'documents', 'objects'
-        ]
-        
-        # Try to find array fields first
-        for field in content_fields:
-            if field in data and isinstance(data[field], list):
-                for item in data[field][:50]:  # Limit items
+        # Try to find array fields first; one intersection finds the candidates
+        hits = data.keys() & self._CONTENT_FIELDS_SET
+        for field in self._CONTENT_FIELDS:
+            if field in hits and isinstance(data[field], list):
+                for item in islice(data[field], 50):  # Limit items
                     if isinstance(item, dict):
-                        content.append(self._normalize_item(item))
-                return content
+                        normalized = self._normalize_item(item)
+                        if normalized:
+                            yield normalized
+                return
         
         # If no array found, extract from root object
         normalized = self._normalize_item(data)
         if normalized:
-            content.append(normalized)
-        
-        return content
+            yield normalized
     
-    def _extract_from_list(self, data: list) -> List[Dict[str, Any]]:
+    def _extract_from_list(self, data: list) -> Iterator[Dict[str, Any]]:
         """Extract content from list response."""
-        content = []
-        
-        for item in data[:50]:  # Limit items
+        for item in islice(data, 50):  # Limit items
             if isinstance(item, dict):
                 normalized = self._normalize_item(item)
                 if normalized:
-                    content.append(normalized)
+                    yield normalized
             elif isinstance(item, str):
-                content.append({
+                yield {
                     'content': item,
                     'type': 'string'
-                })
-        
-        return content
+                }
     
     def _extract_from_string(self, data: str) -> List[Dict[str, Any]]:
         """Extract content from string response (XML, HTML, etc.)."""
@@ -249,26 +460,31 @@ class ApiAnalyzer:
         
         try:
             # Try to parse as XML/HTML
-            if data.strip().startswith('<'):
-                soup = BeautifulSoup(data, 'xml')
+            if _markup_kind(data):
+                root = etree.fromstring(data.encode('utf-8'), _XML_PARSER)
+                if root is None:
+                    raise ValueError("Unparseable XML")
                 
                 # Extract text content
-                text_content = soup.get_text(strip=True)
+                text_content = _element_text(root, 1000)
                 if text_content:
                     content.append({
-                        'content': text_content[:1000],
+                        'content': text_content,
                         'type': 'xml_text',
                         'source': 'xml_parsing'
                     })
                 
                 # Extract structured elements
-                for element in soup.find_all(True)[:20]:  # Limit elements
-                    if element.name and element.get_text(strip=True):
+                for index, element in enumerate(root.iter(etree.Element)):
+                    if index >= 20:  # Limit elements
+                        break
+                    element_text = _element_text(element, 500)
+                    if element_text:
                         content.append({
-                            'tag': element.name,
-                            'content': element.get_text(strip=True)[:500],
+                            'tag': etree.QName(element).localname,
+                            'content': element_text,
                             'type': 'xml_element',
-                            'attributes': dict(element.attrs) if element.attrs else {}
+                            'attributes': dict(element.attrib)
                         })
             
             else:
@@ -292,49 +508,25 @@ class ApiAnalyzer:
         if not isinstance(item, dict):
             return None
         
+        # Take the first non-empty source for each common field, probing only
+        # the sources this item shape actually has
         normalized = {}
-        
-        # Common field mappings
-        title_fields = ['title', 'name', 'headline', 'subject', 'summary']
-        content_fields = ['content', 'description', 'body', 'text', 'message']
-        url_fields = ['url', 'link', 'href', 'permalink']
-        date_fields = ['date', 'created_at', 'updated_at', 'published_at', 'timestamp']
-        id_fields = ['id', 'uuid', 'key', 'identifier']
-        
-        # Extract common fields
-        for field in title_fields:
-            if field in item and item[field]:
-                normalized['title'] = str(item[field])[:200]
-                break
-        
-        for field in content_fields:
-            if field in item and item[field]:
-                normalized['content'] = str(item[field])[:1000]
-                break
-        
-        for field in url_fields:
-            if field in item and item[field]:
-                normalized['url'] = str(item[field])
-                break
-        
-        for field in date_fields:
-            if field in item and item[field]:
-                normalized['date'] = str(item[field])
-                break
-        
-        for field in id_fields:
-            if field in item and item[field]:
-                normalized['id'] = str(item[field])
-                break
+        for field, sources, max_length in _normalization_plan(frozenset(item.keys() & _SOURCE_FIELDS)):
+            for source in sources:
+                value = item[source]
+                if value:
+                    normalized[field] = _truncate(value, max_length)
+                    break
         
         # Add other fields as metadata
         metadata = {}
         for key, value in item.items():
-            if key not in normalized and value is not None:
-                if isinstance(value, (str, int, float, bool)):
+            if key not in normalized:
+                value_type = type(value)
+                if value_type in _SIMPLE_TYPES:
                     metadata[key] = value
-                elif isinstance(value, (list, dict)):
-                    metadata[key] = str(value)[:100]  # Truncate complex types
+                elif value_type in _COMPLEX_TYPES:
+                    metadata[key] = _truncated_str(value, 100)  # Truncate complex types
         
         if metadata:
             normalized['metadata'] = metadata
@@ -352,19 +544,10 @@ class ApiAnalyzer:
         
         # Simple schema detection based on structure
         if isinstance(data, dict):
-            keys = set(data.keys())
-            
             # Common API patterns
-            if {'items', 'total', 'page'}.issubset(keys):
-                return "paginated_api"
-            elif {'data', 'meta'}.issubset(keys):
-                return "jsonapi"
-            elif {'results'}.issubset(keys):
-                return "search_results"
-            elif {'feed', 'entries'}.issubset(keys):
-                return "feed_api"
-            else:
-                return "generic_object"
+            if len(data) > _MAX_CACHED_KEYS:
+                return _match_schema(data.keys())
+            return _object_schema(frozenset(data))
         
         elif isinstance(data, list):
             if data and isinstance(data[0], dict):
@@ -373,12 +556,7 @@ class ApiAnalyzer:
                 return "simple_array"
         
         elif isinstance(data, str):
-            if data.strip().startswith('<?xml'):
-                return "xml"
-            elif data.strip().startswith('<'):
-                return "html"
-            else:
-                return "text"
+            return _markup_kind(data) or "text"
         
         return "unknown"
     
@@ -415,10 +593,12 @@ class ApiAnalyzer:
         
         # Score based on structure consistency
         if len(extracted_content) > 1:
-            first_keys = set(extracted_content[0].keys())
+            # Key views intersect directly, so no per-item sets are built
+            first_keys = extracted_content[0].keys()
+            threshold = len(first_keys) * 0.5
             consistent_items = sum(
-                1 for item in extracted_content[1:6]  # Check first 5 additional items
-                if len(set(item.keys()).intersection(first_keys)) >= len(first_keys) * 0.5
+                1 for item in islice(extracted_content, 1, 6)  # Check first 5 additional items
+                if len(item.keys() & first_keys) >= threshold
             )
             consistency_ratio = consistent_items / min(len(extracted_content) - 1, 5)
             quality_score += consistency_ratio * 0.3
@@ -429,10 +609,9 @@ class ApiAnalyzer:
         """Extract title for API-based page analysis."""
         # Try to get title from metadata
         if isinstance(raw_data, dict):
-            title_fields = ['title', 'name', 'api_name', 'service_name']
-            for field in title_fields:
+            for field in self._API_TITLE_FIELDS:
                 if field in raw_data and raw_data[field]:
-                    return str(raw_data[field])[:200]
+                    return _truncate(raw_data[field], 200)
         
         # Fall back to first item title
         if extracted_content and extracted_content[0].get('title'):
@@ -444,10 +623,9 @@ class ApiAnalyzer:
     def _extract_api_description(self, raw_data: Any, extracted_content: List[Dict[str, Any]]) -> Optional[str]:
         """Extract description for API-based page analysis."""
         if isinstance(raw_data, dict):
-            desc_fields = ['description', 'summary', 'about']
-            for field in desc_fields:
+            for field in self._API_DESCRIPTION_FIELDS:
                 if field in raw_data and raw_data[field]:
-                    return str(raw_data[field])[:500]
+                    return _truncate(raw_data[field], 500)
         
         # Generate description from content
         if extracted_content:
@@ -462,7 +640,7 @@ class ApiAnalyzer:
         
         content_parts = []
         
-        for item in extracted_content[:20]:  # Limit to 20 items
+        for item in islice(extracted_content, 20):  # Limit to 20 items
             parts = []
             
             if item.get('title'):
@@ -501,20 +679,17 @@ class ApiAnalyzer:
         if not extracted_content:
             return 0.0
         
-        now = datetime.now()
+        now_ts = time.time()
         fresh_items = 0
         
         for item in extracted_content[:10]:
             date_str = item.get('date')
             if date_str:
                 try:
-                    from dateutil import parser
-                    item_date = parser.parse(date_str)
-                    # Make timezone-naive for comparison
-                    if item_date.tzinfo is not None:
-                        item_date = item_date.replace(tzinfo=None)
-                    
-                    days_old = (now - item_date).days
+                    # Plain float arithmetic on POSIX timestamps; naive dates are
+                    # taken as local time, as datetime.now() did before
+                    item_ts = _parse_date(date_str).timestamp()
+                    days_old = (now_ts - item_ts) // 86400
                     
                     if days_old <= 1:
                         fresh_items += 1.0
@@ -533,20 +708,17 @@ class ApiAnalyzer:
     
     def _extract_api_links(self, extracted_content: List[Dict[str, Any]]) -> List[str]:
         """Extract links from API content."""
-        links = []
-        
-        for item in extracted_content[:50]:  # Process first 50 items
-            url = item.get('url')
-            if url and url not in links:
-                links.append(url)
-        
-        return links
+        # dict.fromkeys drops duplicates while keeping first-seen order
+        return list(dict.fromkeys(
+            item['url'] for item in islice(extracted_content, 50)  # Process first 50 items
+            if item.get('url')
+        ))
     
     def _api_error_result(self, url: str, error_msg: str, start_time: float) -> ApiAnalysis:
         """Create error result for failed API analysis."""
         processing_time = time.time() - start_time
         
-        return ApiAnalysis(
+        return ApiAnalysis.model_construct(
             endpoint_url=url,
             response_structure="error",
             extracted_content=[],
@@ -561,15 +733,15 @@ class ApiAnalyzer:
         """Create error result for failed page analysis of API."""
         processing_time = time.time() - start_time
         
-        return PageAnalysis(
+        return PageAnalysis.model_construct(
             url=url,
             content_type=ContentType.API,
             status=status,
             error_message=error_msg,
-            analyzed_at=datetime.now(),
+            analyzed_at=start_time,
             processing_time=processing_time
         )
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
\ No newline at end of file
+        """Release the shared HTTP client, closing it if no other analyzer uses it."""
+        await release_client(self.config)
\ No newline at end of file
@@ -1,14 +1,19 @@
 """RSS/Atom feed analyzer for content feeds."""
 
+import asyncio
+import calendar
+import re
 import time
-from datetime import datetime
-from typing import List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import feedparser
 import httpx
-from langdetect import detect
-from langdetect.lang_detect_exception import LangDetectException as LangDetectError
+import lxml.html
+from lxml import etree
 
 from ..analysis_types import (
     FeedDiscovery,
@@ -19,19 +24,155 @@ from ..analysis_types import (
     AnalysisStatus,
     AnalysisConfig
 )
+from .http_client import PooledClient, acquire_client, release_client
+from .language import detect_language
+
+
+# Candidate feeds validated at once during discovery
+_MAX_CONCURRENT_FEED_CHECKS = 8
+
+# Common feed locations guessed relative to the site root
+_COMMON_FEED_PATHS = (
+    '/feed', '/feeds', '/rss', '/rss.xml', '/atom.xml',
+    '/feeds/all.atom.xml', '/index.xml', '/feed.xml'
+)
+
+# Guessed feed paths are checked with a quick HEAD before any full download
+_FEED_PROBE_TIMEOUT = 5.0
+_FEED_CONTENT_TYPE_MARKERS = ('xml', 'rss', 'atom', 'json')
+
+# Candidate feeds are only parsed if one of these appears in the first bytes;
+# otherwise they are ordinary pages (e.g. SPA fallbacks) or other documents
+_FEED_SNIFF_BYTES = 512
+_FEED_PREFIX_MARKERS = (b'<rss', b'<feed', b'<rdf', b'<?xml', b'{')
+
+# First element name in a document, skipping the XML declaration, comments and doctype
+_ROOT_TAG_RE = re.compile(rb'<([A-Za-z][\w.:-]*)')
+
+# Parsed feeds kept for revalidation with If-None-Match / If-Modified-Since
+_FEED_CACHE_SIZE = 128
+
+
+# hrefs of <link rel="alternate"> elements whose type declares a feed, matched
+# case-insensitively in one traversal
+_LOWER = "translate({}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_FEED_LINK_HREFS = etree.XPath(
+    "//link[contains({rel}, 'alternate') and (contains({type}, 'rss') or contains({type}, 'atom')"
+    " or contains({type}, 'xml') or contains({type}, 'feed'))]/@href".format(
+        rel=_LOWER.format('@rel'), type=_LOWER.format('@type')
+    )
+)
+
+
+# Text nodes as BeautifulSoup's get_text() sees them: script and style contents excluded
+_TEXT_NODES = etree.XPath('.//text()[not(ancestor::script) and not(ancestor::style)]')
+
+
+def _entry_age_days(entry, now: int) -> Optional[int]:
+    """Return the age in whole days of a feed entry at epoch time `now`, or None if it is undated."""
+    # feedparser dates are UTC tuples, so timegm gives their real instant
+    date_parsed = entry.get('updated_parsed') or entry.get('published_parsed')
+    if date_parsed:
+        try:
+            return (now - calendar.timegm(date_parsed[:6])) // 86400
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return None
+
+
+class _EntryFields(NamedTuple):
+    """Fields of the leading feed entries, read once for the extractors and scores."""
+    titles: List[str]
+    contents: List[str]  # content value, else summary, else description
+    links: List[Optional[str]]
+    has_content: List[bool]  # any content, summary or description
+    dated: List[bool]
+    ages: List[Optional[int]]  # whole days, None if undated
+
+
+def _entry_fields(entries: List, now: int, limit: int = 20) -> _EntryFields:
+    """Read the fields of the first `limit` feed entries in a single pass, dating them against `now`."""
+    fields = _EntryFields([], [], [], [], [], [])
+    
+    for entry in entries[:limit]:
+        fields.titles.append(entry.get('title', ''))
+        fields.contents.append(entry.get('content', [{}])[0].get('value', '') or
+                               entry.get('summary', '') or
+                               entry.get('description', ''))
+        fields.links.append(entry.get('link'))
+        fields.has_content.append(bool(entry.get('content') or entry.get('summary') or entry.get('description')))
+        fields.dated.append(bool(entry.get('published_parsed') or entry.get('updated_parsed')))
+        fields.ages.append(_entry_age_days(entry, now))
+    
+    return fields
+
+
+def _has_feed_marker(prefix: bytes) -> bool:
+    """Tell whether the start of a response body could belong to a feed."""
+    head = bytes(prefix[:_FEED_SNIFF_BYTES]).lower()
+    return any(marker in head for marker in _FEED_PREFIX_MARKERS)
+
+
+def _sniff_feed_type(prefix: bytes) -> Optional[FeedType]:
+    """Classify a feed from the start of its body, or None if the prefix is inconclusive."""
+    head = bytes(prefix[:_FEED_SNIFF_BYTES]).lstrip(b'\xef\xbb\xbf \t\r\n')
+    if head.startswith(b'{'):
+        return FeedType.JSON
+    
+    match = _ROOT_TAG_RE.search(head)
+    if match is None:
+        return None
+    root = match.group(1).rpartition(b':')[2].lower()
+    if root == b'feed':
+        return FeedType.ATOM
+    if root in (b'rss', b'rdf'):
+        return FeedType.RSS
+    return None
+
+
+class _FeedResponse(NamedTuple):
+    """What is kept of a feed response once its body is parsed (cached, so no body)."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_type: str
+    content_length: int
+    status_code: int
+    elapsed: timedelta
+    sniffed_type: Optional[FeedType]  # from the root element, when it is clear
+
+
+def _html_text(content: str) -> str:
+    """Plain text of an HTML fragment, parsed with lxml (BeautifulSoup as fallback)."""
+    try:
+        return ''.join(_TEXT_NODES(lxml.html.fromstring(content)))
+    except (etree.ParserError, ValueError):
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(content, 'html.parser').get_text()
+
+
+# Below this many characters langdetect's guess is mostly noise, so feeds
+# without a declared language and with a shorter title/description get none
+_MIN_DETECT_LENGTH = 20
+
+# langdetect is pure Python and takes milliseconds per sample, so it runs here
+# rather than on the event loop
+_DETECT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="langdetect")
 
 
 class FeedAnalyzer:
     """Analyzer for RSS/Atom feeds and feed discovery."""
     
+    # Shares pooled connections with the other analyzers for the same settings
+    client = PooledClient()
+    
     def __init__(self, config: Optional[AnalysisConfig] = None):
         """Initialize feed analyzer with configuration."""
         self.config = config or AnalysisConfig()
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(self.config.timeout),
-            follow_redirects=self.config.follow_redirects,
-            headers={"User-Agent": self.config.user_agent}
-        )
+        acquire_client(self.config)
+        # feed URL -> (feed response, parsed feed), least recently used first
+        self._feed_cache: "OrderedDict[str, Tuple[_FeedResponse, Any]]" = OrderedDict()
+        # feed URL -> (parsed feed, analysis of it), for feeds still in _feed_cache
+        self._feed_analyses: Dict[str, Tuple[Any, PageAnalysis]] = {}
     
     async def discover_feeds(self, url: str, discovery_depth: int = 2) -> FeedDiscovery:
         """
@@ -56,11 +197,33 @@ class FeedAnalyzer:
                 # Search for feeds on the page
                 discovered_feeds = await self._discover_feeds_from_page(url)
                 
-                # Validate discovered feeds
-                for feed_url in discovered_feeds[:10]:  # Limit validation to 10 feeds
-                    feed_info = await self._analyze_direct_feed(feed_url)
-                    if feed_info:
-                        feeds_found.append(feed_info)
+                # Validate discovered feeds concurrently, bounded so slow hosts
+                # can't tie up every connection. The first feeds to validate win:
+                # the rest are cancelled, and the winners keep discovery order.
+                semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FEED_CHECKS)
+                
+                async def validate(index: int, feed_url: str) -> Tuple[int, Optional[FeedInfo]]:
+                    async with semaphore:
+                        return index, await self._analyze_direct_feed(feed_url)
+                
+                tasks = [
+                    asyncio.ensure_future(validate(index, feed_url))
+                    for index, feed_url in enumerate(discovered_feeds[:10])  # Limit validation to 10 feeds
+                ]
+                validated = {}
+                try:
+                    for next_result in asyncio.as_completed(tasks):
+                        index, feed_info = await next_result
+                        if feed_info:
+                            validated[index] = feed_info
+                            if len(validated) >= self.config.feed_discovery_stop_after:
+                                break
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                
+                feeds_found.extend(validated[index] for index in sorted(validated))
             
             discovery_time = time.time() - start_time
             
@@ -96,46 +259,55 @@ class FeedAnalyzer:
         start_time = time.time()
         
         try:
-            # Fetch the feed
-            response = await self.client.get(feed_url)
-            response.raise_for_status()
-            
-            # Parse the feed
-            parsed_feed = feedparser.parse(response.content)
+            # Fetch and parse the feed
+            response, parsed_feed = await self._fetch_feed(feed_url)
+            fetch_time = time.time() - start_time
             
             if parsed_feed.bozo and not parsed_feed.entries:
                 return self._error_result(feed_url, "Invalid or empty feed", start_time)
             
+            # A 304 hands back the parsed feed we already analyzed; only the
+            # freshness score depends on the current time
+            cached = self._feed_analyses.get(feed_url)
+            if cached is not None and cached[0] is parsed_feed:
+                fields = _entry_fields(parsed_feed.entries, int(start_time))
+                return cached[1].model_copy(update={
+                    'freshness_score': self._compute_scores(parsed_feed, fields)[2],
+                    'response_time': fetch_time,
+                    'analyzed_at': start_time,
+                    'processing_time': time.time() - start_time
+                })
+            
             # Extract feed metadata
             feed_info = parsed_feed.feed
             title = feed_info.get('title', '')
             description = feed_info.get('description', '') or feed_info.get('subtitle', '')
             
             # Extract language
-            language = self._extract_feed_language(feed_info)
+            language = await self._extract_feed_language(feed_info)
             
             # Extract dates
             published_date = self._parse_feed_date(feed_info.get('published_parsed'))
             last_modified = self._parse_feed_date(feed_info.get('updated_parsed'))
             
             # Generate content summary from recent entries
-            main_content = self._extract_feed_content(parsed_feed.entries)
-            summary = self._generate_feed_summary(parsed_feed.entries[:5])  # Use first 5 entries
+            # Entry ages are measured from the same instant as analyzed_at
+            fields = _entry_fields(parsed_feed.entries, int(start_time))
+            main_content = self._extract_feed_content(fields)
+            summary = self._generate_feed_summary(fields)
             
             # Determine feed type
-            feed_type = self._determine_feed_type(parsed_feed, response.headers)
+            feed_type = self._determine_feed_type(parsed_feed, response.content_type)
             
             # Calculate scores
-            relevance_score = self._calculate_feed_relevance_score(parsed_feed)
-            quality_score = self._calculate_feed_quality_score(parsed_feed)
-            freshness_score = self._calculate_feed_freshness_score(parsed_feed.entries)
+            relevance_score, quality_score, freshness_score = self._compute_scores(parsed_feed, fields)
             
             # Extract links from entries
-            external_links = self._extract_feed_links(parsed_feed.entries)
+            external_links = self._extract_feed_links(fields)
             
             processing_time = time.time() - start_time
             
-            return PageAnalysis(
+            analysis = PageAnalysis(
                 url=feed_url,
                 content_type=ContentType.RSS if feed_type == FeedType.RSS else ContentType.ATOM,
                 status=AnalysisStatus.SUCCESS,
@@ -151,12 +323,19 @@ class FeedAnalyzer:
                 freshness_score=freshness_score,
                 external_links=external_links,
                 response_time=response.elapsed.total_seconds(),
-                content_length=len(response.content),
+                content_length=response.content_length,
                 status_code=response.status_code,
-                analyzed_at=datetime.now(),
+                analyzed_at=start_time,
                 processing_time=processing_time
             )
             
+            if feed_url in self._feed_cache:
+                self._feed_analyses[feed_url] = (parsed_feed, analysis)
+                for evicted in [url for url in self._feed_analyses if url not in self._feed_cache]:
+                    del self._feed_analyses[evicted]
+            
+            return analysis
+            
         except httpx.TimeoutException:
             return self._error_result(feed_url, "Request timeout", start_time, AnalysisStatus.TIMEOUT)
         except httpx.HTTPStatusError as e:
@@ -167,11 +346,10 @@ class FeedAnalyzer:
     async def _analyze_direct_feed(self, feed_url: str) -> Optional[FeedInfo]:
         """Analyze a URL to see if it's a valid feed."""
         try:
-            response = await self.client.get(feed_url)
-            response.raise_for_status()
-            
-            # Parse feed
-            parsed_feed = feedparser.parse(response.content)
+            fetched = await self._fetch_feed(feed_url, skip_non_feeds=True)
+            if fetched is None:
+                return None
+            response, parsed_feed = fetched
             
             if parsed_feed.bozo and not parsed_feed.entries:
                 return None
@@ -181,8 +359,9 @@ class FeedAnalyzer:
             title = feed_info.get('title', '')
             description = feed_info.get('description', '') or feed_info.get('subtitle', '')
             
-            # Determine feed type
-            feed_type = self._determine_feed_type(parsed_feed, response.headers)
+            # Determine feed type, from the root element when it is clear
+            feed_type = (response.sniffed_type or
+                         self._determine_feed_type(parsed_feed, response.content_type))
             
             # Extract last updated
             last_updated = self._parse_feed_date(feed_info.get('updated_parsed'))
@@ -191,7 +370,7 @@ class FeedAnalyzer:
             is_active = self._is_feed_active(parsed_feed.entries)
             
             # Detect language
-            language = self._extract_feed_language(feed_info)
+            language = await self._extract_feed_language(feed_info)
             
             return FeedInfo(
                 url=feed_url,
@@ -207,51 +386,143 @@ class FeedAnalyzer:
         except Exception:
             return None
     
+    async def _fetch_feed(self, feed_url: str, skip_non_feeds: bool = False) -> Optional[Tuple[_FeedResponse, Any]]:
+        """
+        Fetch and parse a feed, revalidating a cached copy when there is one.
+        
+        Feeds that send an ETag or Last-Modified header are cached, so the
+        discover-then-analyze flow and repeated polling get a 304 instead of
+        downloading and parsing the feed again. The body is streamed into a
+        single buffer and the download abandoned past max_feed_length, which
+        counts decoded bytes so compressed feeds can't inflate past it. Only
+        the parsed feed and a small _FeedResponse are kept, never the body.
+        
+        With skip_non_feeds, a response with no feed markup in its first bytes
+        is abandoned without parsing and None is returned.
+        """
+        cached = self._feed_cache.get(feed_url)
+        headers = {}
+        if cached is not None:
+            if cached[0].etag:
+                headers['If-None-Match'] = cached[0].etag
+            if cached[0].last_modified:
+                headers['If-Modified-Since'] = cached[0].last_modified
+        
+        async with self.client.stream("GET", feed_url, headers=headers) as response:
+            if cached is not None and response.status_code == 304:
+                self._feed_cache.move_to_end(feed_url)
+                return cached
+            response.raise_for_status()
+            
+            # A declared length is at most the decoded size, so it can reject early
+            max_length = self.config.max_feed_length
+            declared = response.headers.get("content-length")
+            if declared and declared.isdigit() and int(declared) > max_length:
+                raise ValueError(f"Feed too large (over {max_length} bytes)")
+            
+            sniff = skip_non_feeds
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body.extend(chunk)
+                if sniff and len(body) >= _FEED_SNIFF_BYTES:
+                    if not _has_feed_marker(body):
+                        return None
+                    sniff = False
+                if len(body) > max_length:
+                    raise ValueError(f"Feed too large (over {max_length} bytes)")
+            if sniff and not _has_feed_marker(body):
+                return None
+        
+        content = bytes(body)
+        del body
+        parsed_feed = feedparser.parse(content)
+        response = _FeedResponse(
+            etag=response.headers.get('etag'),
+            last_modified=response.headers.get('last-modified'),
+            content_type=response.headers.get('content-type', ''),
+            content_length=len(content),
+            status_code=response.status_code,
+            elapsed=response.elapsed,
+            sniffed_type=_sniff_feed_type(content[:_FEED_SNIFF_BYTES])
+        )
+        del content
+        
+        if response.etag or response.last_modified:
+            self._feed_cache[feed_url] = (response, parsed_feed)
+            self._feed_cache.move_to_end(feed_url)
+            if len(self._feed_cache) > _FEED_CACHE_SIZE:
+                self._feed_cache.popitem(last=False)
+        else:
+            self._feed_cache.pop(feed_url, None)
+        
+        return response, parsed_feed
+    
     async def _discover_feeds_from_page(self, url: str) -> List[str]:
         """Discover feed URLs from a webpage."""
         try:
-            response = await self.client.get(url)
-            response.raise_for_status()
+            # Only the raw bytes are needed: lxml reads the declared encoding
+            # itself, and a page cut off at max_content_length still parses
+            async with self.client.stream("GET", url) as response:
+                response.raise_for_status()
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body.extend(chunk)
+                    if len(body) >= self.config.max_content_length:
+                        break
             
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, 'html.parser')
+            try:
+                document = lxml.html.fromstring(bytes(body))
+            except etree.ParserError:
+                document = None  # empty page: no declared feeds
             
             feeds = []
+            seen = set()
             
             # Look for feed links in HTML head
-            feed_links = soup.find_all('link', rel=lambda x: x and 'alternate' in x.lower())
+            feed_hrefs = _FEED_LINK_HREFS(document) if document is not None else ()
             
-            for link in feed_links:
-                href = link.get('href')
-                type_attr = link.get('type', '').lower()
-                
-                if href and any(feed_type in type_attr for feed_type in 
-                              ['rss', 'atom', 'xml', 'feed']):
+            for href in feed_hrefs:
+                if href:
                     full_url = urljoin(url, href)
-                    if full_url not in feeds:
+                    if full_url not in seen:
+                        seen.add(full_url)
                         feeds.append(full_url)
             
-            # Look for common feed URLs
-            base_domain = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
-            common_feeds = [
-                '/feed', '/feeds', '/rss', '/rss.xml', '/atom.xml', 
-                '/feeds/all.atom.xml', '/index.xml', '/feed.xml'
-            ]
+            # Look for common feed URLs; these are guesses, so only keep the ones
+            # a concurrent HEAD probe says could be feeds
+            parsed_url = urlparse(url)
+            base_domain = f"{parsed_url.scheme}://{parsed_url.netloc}"
             
-            for feed_path in common_feeds:
-                feed_url = base_domain + feed_path
-                if feed_url not in feeds:
-                    feeds.append(feed_url)
+            guesses = [base_domain + feed_path for feed_path in _COMMON_FEED_PATHS]
+            guesses = [feed_url for feed_url in guesses if feed_url not in seen]
+            probes = await asyncio.gather(*(self._probe_feed_url(feed_url) for feed_url in guesses))
+            feeds.extend(feed_url for feed_url, plausible in zip(guesses, probes) if plausible)
             
             return feeds
             
         except Exception:
             return []
     
-    def _determine_feed_type(self, parsed_feed, headers: dict) -> FeedType:
-        """Determine the type of feed (RSS, Atom, JSON)."""
+    async def _probe_feed_url(self, url: str) -> bool:
+        """Check with a HEAD request whether a URL could serve a feed."""
+        try:
+            response = await self.client.head(url, timeout=_FEED_PROBE_TIMEOUT)
+        except httpx.HTTPError:
+            return False
+        
+        # Servers that don't support HEAD are left for the full GET to decide
+        if response.status_code in (405, 501):
+            return True
+        if response.status_code >= 400:
+            return False
+        
+        content_type = response.headers.get('content-type', '').lower()
+        return not content_type or any(marker in content_type for marker in _FEED_CONTENT_TYPE_MARKERS)
+    
+    def _determine_feed_type(self, parsed_feed, content_type: str) -> FeedType:
+        """Determine the type of feed (RSS, Atom, JSON) from its Content-Type header and version."""
         # Check content type header
-        content_type = headers.get('content-type', '').lower()
+        content_type = content_type.lower()
         
         if 'json' in content_type:
             return FeedType.JSON
@@ -270,7 +541,7 @@ class FeedAnalyzer:
         # Default to RSS if uncertain
         return FeedType.RSS
     
-    def _extract_feed_language(self, feed_info: dict) -> Optional[str]:
+    async def _extract_feed_language(self, feed_info: dict) -> Optional[str]:
         """Extract language from feed metadata."""
         # Try various language fields
         language = (feed_info.get('language') or 
@@ -284,11 +555,9 @@ class FeedAnalyzer:
         text_sample = (feed_info.get('title', '') + ' ' + 
                       feed_info.get('description', ''))[:1000]
         
-        if text_sample.strip():
-            try:
-                return detect(text_sample)
-            except LangDetectError:
-                pass
+        if len(text_sample.strip()) >= _MIN_DETECT_LENGTH:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_DETECT_POOL, detect_language, text_sample)
         
         return None
     
@@ -301,43 +570,26 @@ class FeedAnalyzer:
                 pass
         return None
     
-    def _extract_feed_content(self, entries: List) -> Optional[str]:
+    def _extract_feed_content(self, fields: _EntryFields) -> Optional[str]:
         """Extract content from feed entries."""
-        if not entries:
-            return None
-        
         content_parts = []
         
-        for entry in entries[:10]:  # Use first 10 entries
-            # Extract title
-            title = entry.get('title', '')
+        # Use first 10 entries
+        for title, content in zip(fields.titles[:10], fields.contents[:10]):
             if title:
                 content_parts.append(f"Title: {title}")
             
-            # Extract content/summary
-            content = (entry.get('content', [{}])[0].get('value', '') or
-                      entry.get('summary', '') or
-                      entry.get('description', ''))
-            
             if content:
                 # Clean HTML if present
-                from bs4 import BeautifulSoup
-                clean_content = BeautifulSoup(content, 'html.parser').get_text()
+                clean_content = _html_text(content)
                 content_parts.append(clean_content[:500])  # Limit entry content
         
         return '\n\n'.join(content_parts) if content_parts else None
     
-    def _generate_feed_summary(self, entries: List) -> Optional[str]:
+    def _generate_feed_summary(self, fields: _EntryFields) -> Optional[str]:
         """Generate summary from recent feed entries."""
-        if not entries:
-            return None
-        
-        summary_parts = []
-        
-        for entry in entries[:3]:  # Use first 3 entries for summary
-            title = entry.get('title', '')
-            if title:
-                summary_parts.append(title)
+        # Use first 3 entries for summary
+        summary_parts = [title for title in fields.titles[:3] if title]
         
         if summary_parts:
             summary = "Recent entries: " + "; ".join(summary_parts)
@@ -350,165 +602,109 @@ class FeedAnalyzer:
         if not entries:
             return False
         
-        now = datetime.now()
-        
+        now = int(time.time())
         for entry in entries[:5]:  # Check first 5 entries
-            published = self._parse_feed_date(entry.get('published_parsed'))
-            updated = self._parse_feed_date(entry.get('updated_parsed'))
-            
-            entry_date = updated or published
-            if entry_date:
-                days_old = (now - entry_date).days
-                if days_old <= 30:
-                    return True
+            days_old = _entry_age_days(entry, now)
+            if days_old is not None and days_old <= 30:
+                return True
         
         return False
     
-    def _calculate_feed_relevance_score(self, parsed_feed) -> float:
-        """Calculate feed relevance score."""
+    def _compute_scores(self, parsed_feed, fields: _EntryFields) -> Tuple[float, float, float]:
+        """Calculate feed relevance, quality and freshness scores in one pass over the entries."""
         if not self.config.calculate_scores:
-            return 0.0
+            return 0.0, 0.0, 0.0
         
-        score = 0.0
         feed_info = parsed_feed.feed
         entries = parsed_feed.entries
         
         # Score based on feed metadata
+        relevance = 0.0
         if feed_info.get('title'):
-            score += 0.2
+            relevance += 0.2
         if feed_info.get('description'):
-            score += 0.2
-        
-        # Score based on entries
-        if entries:
-            score += 0.3
-            
-            # Bonus for multiple entries
-            if len(entries) >= 5:
-                score += 0.1
-            if len(entries) >= 10:
-                score += 0.1
-            
-            # Check for content quality in entries
-            content_entries = 0
-            for entry in entries[:5]:
-                if (entry.get('content') or entry.get('summary') or entry.get('description')):
-                    content_entries += 1
-            
-            if content_entries >= 3:
-                score += 0.1
-        
-        return min(score, 1.0)
-    
-    def _calculate_feed_quality_score(self, parsed_feed) -> float:
-        """Calculate feed quality score."""
-        if not self.config.calculate_scores:
-            return 0.0
-        
-        score = 0.0
-        feed_info = parsed_feed.feed
-        entries = parsed_feed.entries
+            relevance += 0.2
         
         # Check for proper feed metadata
+        quality = 0.0
         if feed_info.get('title') and len(feed_info.get('title', '')) > 5:
-            score += 0.2
+            quality += 0.2
         if feed_info.get('description') and len(feed_info.get('description', '')) > 20:
-            score += 0.2
+            quality += 0.2
         if feed_info.get('link'):
-            score += 0.1
+            quality += 0.1
         
-        # Check entry quality
-        if entries:
-            quality_entries = 0
-            for entry in entries[:10]:
-                entry_score = 0
-                
-                # Check for title
-                if entry.get('title'):
-                    entry_score += 1
-                
-                # Check for content
-                content = (entry.get('content', [{}])[0].get('value', '') or
-                          entry.get('summary', '') or
-                          entry.get('description', ''))
-                if content and len(content) > 50:
-                    entry_score += 1
-                
-                # Check for date
-                if (entry.get('published_parsed') or entry.get('updated_parsed')):
-                    entry_score += 1
-                
-                # Check for link
-                if entry.get('link'):
-                    entry_score += 1
-                
-                if entry_score >= 3:
-                    quality_entries += 1
-            
-            # Score based on percentage of quality entries
-            if entries:
-                quality_ratio = quality_entries / min(len(entries), 10)
-                score += quality_ratio * 0.5
-        
-        return min(score, 1.0)
-    
-    def _calculate_feed_freshness_score(self, entries: List) -> float:
-        """Calculate feed freshness score based on recent entries."""
-        if not self.config.calculate_scores or not entries:
-            return 0.0
+        if not entries:
+            return min(relevance, 1.0), min(quality, 1.0), 0.0
         
-        now = datetime.now()
+        # Score based on entries
+        relevance += 0.3
+        if len(entries) >= 5:
+            relevance += 0.1
+        if len(entries) >= 10:
+            relevance += 0.1
+        
+        # Check for content quality in the first 5 entries
+        content_entries = sum(fields.has_content[:5])
+        quality_entries = 0
         recent_entries = 0
         
-        for entry in entries[:10]:
-            published = self._parse_feed_date(entry.get('published_parsed'))
-            updated = self._parse_feed_date(entry.get('updated_parsed'))
-            
-            entry_date = updated or published
-            if entry_date:
-                days_old = (now - entry_date).days
-                
-                if days_old <= 1:
-                    recent_entries += 1.0
-                elif days_old <= 7:
-                    recent_entries += 0.8
-                elif days_old <= 30:
-                    recent_entries += 0.4
-                elif days_old <= 90:
-                    recent_entries += 0.2
-        
-        # Score based on recent entries
-        if entries:
-            freshness_ratio = recent_entries / min(len(entries), 10)
-            return min(freshness_ratio, 1.0)
-        
-        return 0.0
+        for i in range(min(len(entries), 10)):
+            # Entry quality: title, substantial content, date and link
+            entry_score = 0
+            if fields.titles[i]:
+                entry_score += 1
+            content = fields.contents[i]
+            if content and len(content) > 50:
+                entry_score += 1
+            if fields.dated[i]:
+                entry_score += 1
+            if fields.links[i]:
+                entry_score += 1
+            if entry_score >= 3:
+                quality_entries += 1
+            
+            # Freshness weighted by entry age
+            days_old = fields.ages[i]
+            if days_old is None:
+                continue
+            if days_old <= 1:
+                recent_entries += 1.0
+            elif days_old <= 7:
+                recent_entries += 0.8
+            elif days_old <= 30:
+                recent_entries += 0.4
+            elif days_old <= 90:
+                recent_entries += 0.2
+        
+        if content_entries >= 3:
+            relevance += 0.1
+        
+        # Score based on percentage of quality and recent entries
+        scored = min(len(entries), 10)
+        quality += quality_entries / scored * 0.5
+        freshness = recent_entries / scored
+        
+        return min(relevance, 1.0), min(quality, 1.0), min(freshness, 1.0)
     
-    def _extract_feed_links(self, entries: List) -> List[str]:
+    def _extract_feed_links(self, fields: _EntryFields) -> List[str]:
         """Extract links from feed entries."""
-        links = []
-        
-        for entry in entries[:20]:  # Process first 20 entries
-            link = entry.get('link')
-            if link and link not in links:
-                links.append(link)
-        
-        return links
+        return list(dict.fromkeys(link for link in fields.links if link))
     
     def _error_result(self, url: str, error_msg: str, start_time: float,
                      status: AnalysisStatus = AnalysisStatus.ERROR) -> PageAnalysis:
         """Create error result for failed feed analysis."""
         processing_time = time.time() - start_time
         
-        return PageAnalysis(
+        return PageAnalysis.model_construct(
             url=url,
             content_type=ContentType.RSS,
             status=status,
             error_message=error_msg,
-            analyzed_at=datetime.now(),
+            analyzed_at=start_time,
             processing_time=processing_time
         )
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
\ No newline at end of file
+        """Release the shared HTTP client, closing it if no other analyzer uses it."""
+        await release_client(self.config)
\ No newline at end of file
@@ -1,43 +1,253 @@
 """HTML content analyzer for web pages."""
 
+import asyncio
+import functools
 import re
 import time
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import List, Optional, Tuple
-from urllib.parse import urljoin, urlparse
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import ParseResult, urljoin, urlparse
 
 import httpx
-from bs4 import BeautifulSoup, Comment
-from langdetect import detect
-from langdetect.lang_detect_exception import LangDetectException as LangDetectError
+import lxml.html
+from dateutil import parser as date_parser
+from lxml import etree
 from readability import Document
 
 from ..analysis_types import (
     PageAnalysis, 
+    PageMetadata,
     ContentType, 
     AnalysisStatus, 
     AnalysisConfig
 )
+from .http_client import (
+    FetchedPage,
+    PooledClient,
+    acquire_client,
+    analyze_concurrently,
+    release_client
+)
+from .language import detect_language
+
+
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# End of <head>; metadata-only analysis parses up to here first
+_HEAD_END_RE = re.compile(r'</head\s*>', re.IGNORECASE)
+
+# lxml rejects str input that still carries an XML encoding declaration
+_XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+
+_HEADINGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+_FEED_LINK_TYPES = ('rss', 'atom', 'xml', 'feed')
+
+# Metadata sources, in priority order, as keys into _PageNodes.first
+_TITLE_SOURCES = ('title', ('property', 'og:title'), ('name', 'twitter:title'), 'h1')
+_DESCRIPTION_SOURCES = (
+    ('name', 'description'),
+    ('property', 'og:description'),
+    ('name', 'twitter:description')
+)
+_AUTHOR_SOURCES = (
+    ('name', 'author'),
+    ('property', 'article:author'),
+    ('name', 'twitter:creator'),
+    '[rel="author"]',
+    '.author',
+    '.byline'
+)
+_PUBLISHED_SOURCES = (
+    ('property', 'article:published_time'),
+    ('name', 'date'),
+    ('name', 'publishdate'),
+    'time[datetime]',
+    '[datetime]'
+)
+_MODIFIED_SOURCES = (('property', 'article:modified_time'), ('name', 'last-modified'))
+
+
+class _PageNodes(NamedTuple):
+    """What the extractors need from a page, collected in a single pass."""
+    first: Dict[Any, lxml.html.HtmlElement]  # first element per metadata source
+    feed_hrefs: List[str]
+    image_sources: List[str]
+    link_targets: List[str]
+    has_sectioning: bool  # <main> or <article>
+    has_heading: bool
+    has_list: bool
+    has_image_alt: bool
+
+
+def _collect_nodes(tree: lxml.html.HtmlElement) -> _PageNodes:
+    """Walk every element once, in document order, and sort what matters into _PageNodes."""
+    first = {}
+    feed_hrefs, image_sources, link_targets = [], [], []
+    has_sectioning = has_heading = has_list = has_image_alt = False
+    
+    for element in tree.iter(etree.Element):
+        tag = element.tag
+        if tag == 'meta':
+            for attribute in ('name', 'property'):
+                value = element.get(attribute)
+                if value is not None:
+                    first.setdefault((attribute, value), element)
+        elif tag == 'a':
+            href = element.get('href')
+            if href is not None:
+                link_targets.append(href)
+        elif tag == 'img':
+            source = element.get('src')
+            if source is not None:
+                image_sources.append(source)
+            if element.get('alt') is not None:
+                has_image_alt = True
+        elif tag == 'link':
+            rel = (element.get('rel') or '').lower()
+            link_type = (element.get('type') or '').lower()
+            if 'alternate' in rel and any(kind in link_type for kind in _FEED_LINK_TYPES):
+                feed_hrefs.append(element.get('href'))
+        elif tag in _HEADINGS:
+            has_heading = True
+            if tag == 'h1':
+                first.setdefault('h1', element)
+        elif tag == 'title':
+            first.setdefault('title', element)
+        elif tag in ('main', 'article'):
+            has_sectioning = True
+        elif tag in ('ul', 'ol'):
+            has_list = True
+        
+        # Attribute selectors apply to any element, including those above
+        if element.get('datetime') is not None:
+            first.setdefault('[datetime]', element)
+            if tag == 'time':
+                first.setdefault('time[datetime]', element)
+        if element.get('rel') == 'author':
+            first.setdefault('[rel="author"]', element)
+        classes = element.get('class')
+        if classes:
+            classes = classes.split()
+            if 'author' in classes:
+                first.setdefault('.author', element)
+            if 'byline' in classes:
+                first.setdefault('.byline', element)
+    
+    return _PageNodes(first, feed_hrefs, image_sources, link_targets,
+                      has_sectioning, has_heading, has_list, has_image_alt)
+
+
+_BOILERPLATE = etree.XPath('//script | //style | //nav | //footer | //aside')
+_TEXT_NODES = etree.XPath('//text()')
+
+
+# Feed locations guessed for every site, on top of the ones the page links to
+_GUESSED_FEED_PATHS = ('/feed', '/rss', '/rss.xml', '/atom.xml', '/feeds/all.atom.xml')
+
+
+@functools.lru_cache(maxsize=4096)
+def _guessed_feed_urls(origin: str) -> Tuple[str, ...]:
+    """Guessed feed URLs for a scheme://host origin (the same for every page on it)."""
+    return tuple(origin + path for path in _GUESSED_FEED_PATHS)
+
+
+def _head_nodes(markup: str) -> Optional[_PageNodes]:
+    """_PageNodes for just the document up to </head>, or None if there is no </head>."""
+    match = _HEAD_END_RE.search(markup)
+    if match is None:
+        return None
+    head = markup[:match.end()]
+    # A </head> inside a script or comment would cut the head short
+    lowered = head.lower()
+    if lowered.count('<script') != lowered.count('</script') or head.count('<!--') != head.count('-->'):
+        return None
+    return _collect_nodes(_parse_html(head))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_date(date_str: str) -> Optional[datetime]:
+    """Parse an ISO 8601 date (cached, as they repeat across a site's pages), or None."""
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+
+
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse a page or header date, or None."""
+    # C-level ISO 8601 parser first; dateutil's format inference is slow
+    parsed = _parse_iso_date(date_str)
+    if parsed is not None:
+        return parsed
+    # Not cached: dateutil fills missing fields of partial dates from today
+    try:
+        return date_parser.parse(date_str)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_url(url: str) -> ParseResult:
+    """urlparse, cached for page URLs and link targets that repeat across pages."""
+    return urlparse(url)
+
+
+def _parse_html(markup: str) -> lxml.html.HtmlElement:
+    """Parse an HTML document; empty or unparseable markup gives an empty document."""
+    try:
+        return lxml.html.document_fromstring(markup)
+    except ValueError:
+        markup = _XML_DECLARATION_RE.sub('', markup, count=1)
+    except etree.ParserError:
+        return lxml.html.document_fromstring('<html></html>')
+    
+    try:
+        return lxml.html.document_fromstring(markup)
+    except (etree.ParserError, ValueError):
+        return lxml.html.document_fromstring('<html></html>')
+
+
+@functools.lru_cache(maxsize=8)
+def _parser_for(config_json: str) -> "HtmlAnalyzer":
+    """Per-process parser (no HTTP client) for the given serialized config."""
+    return HtmlAnalyzer(AnalysisConfig.model_validate_json(config_json), http=False)
+
+
+def _parse_raw(page: FetchedPage, url: str, config_json: str, start_time: float) -> PageAnalysis:
+    """
+    Parse a fetched page into a PageAnalysis.
+    
+    Module-level and fed only picklable arguments, so it can run in a process pool.
+    """
+    return _parser_for(config_json)._build_analysis(page, url, start_time)
 
 
 class HtmlAnalyzer:
     """Analyzer for HTML web pages with content extraction and metadata analysis."""
     
-    def __init__(self, config: Optional[AnalysisConfig] = None):
-        """Initialize HTML analyzer with configuration."""
+    # Pooled (HTTP/2 when available) client shared with the other analyzers,
+    # so keep-alive connections skip the TCP+TLS handshake on repeat hosts
+    client = PooledClient()
+    
+    def __init__(self, config: Optional[AnalysisConfig] = None, http: bool = True):
+        """Initialize HTML analyzer with configuration (http=False for a parse-only analyzer)."""
         self.config = config or AnalysisConfig()
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(self.config.timeout),
-            follow_redirects=self.config.follow_redirects,
-            headers={"User-Agent": self.config.user_agent}
-        )
+        self._http = http
+        if http:
+            acquire_client(self.config)
     
-    async def analyze(self, url: str) -> PageAnalysis:
+    async def analyze(self, url: str, parse_executor: Optional[Executor] = None) -> PageAnalysis:
         """
         Analyze an HTML page and extract content, metadata, and structure.
         
         Args:
             url: URL of the web page to analyze
+            parse_executor: Optional (process pool) executor to parse the page in;
+                without one the page is parsed on a worker thread. Either way
+                CPU-bound parsing stays off the event loop
             
         Returns:
             PageAnalysis object with extracted content and metadata
@@ -50,72 +260,15 @@ class HtmlAnalyzer:
             if not response:
                 return self._error_result(url, "Failed to fetch page", start_time)
             
-            # Parse HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
+            if parse_executor is not None:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    parse_executor, _parse_raw,
+                    response, url, self.config.model_dump_json(), start_time
+                )
             
-            # Extract basic metadata
-            title = self._extract_title(soup)
-            description = self._extract_description(soup)
-            
-            # Extract main content using readability
-            main_content = self._extract_main_content(response.text, url)
-            
-            # Generate summary from main content
-            summary = self._generate_summary(main_content)
-            
-            # Extract additional metadata
-            author = self._extract_author(soup)
-            published_date = self._extract_published_date(soup)
-            last_modified = self._extract_last_modified(soup, response.headers)
-            
-            # Detect language
-            language = self._detect_language(main_content or title or "")
-            
-            # Calculate quality scores
-            relevance_score = self._calculate_relevance_score(main_content, title, description)
-            quality_score = self._calculate_quality_score(main_content, soup)
-            freshness_score = self._calculate_freshness_score(published_date, last_modified)
-            
-            # Extract resources if configured
-            feeds_discovered = []
-            images = []
-            external_links = []
-            
-            if self.config.discover_feeds:
-                feeds_discovered = self._discover_feeds(soup, url)
-            
-            if self.config.extract_images:
-                images = self._extract_images(soup, url)
-                
-            if self.config.extract_links:
-                external_links = self._extract_external_links(soup, url)
-            
-            processing_time = time.time() - start_time
-            
-            return PageAnalysis(
-                url=url,
-                content_type=ContentType.HTML,
-                status=AnalysisStatus.SUCCESS,
-                title=title,
-                description=description,
-                main_content=main_content,
-                summary=summary,
-                language=language,
-                author=author,
-                published_date=published_date,
-                last_modified=last_modified,
-                relevance_score=relevance_score,
-                quality_score=quality_score,
-                freshness_score=freshness_score,
-                feeds_discovered=feeds_discovered,
-                images=images,
-                external_links=external_links,
-                response_time=response.elapsed.total_seconds(),
-                content_length=len(response.content),
-                status_code=response.status_code,
-                analyzed_at=datetime.now(),
-                processing_time=processing_time
-            )
+            # lxml releases the GIL while parsing, so other fetches keep going
+            return await asyncio.to_thread(self._build_analysis, response, url, start_time)
             
         except httpx.TimeoutException:
             return self._error_result(url, "Request timeout", start_time, AnalysisStatus.TIMEOUT)
@@ -124,51 +277,195 @@ class HtmlAnalyzer:
         except Exception as e:
             return self._error_result(url, str(e), start_time)
     
-    async def _fetch_page(self, url: str) -> Optional[httpx.Response]:
-        """Fetch web page with error handling."""
-        try:
-            response = await self.client.get(url)
-            response.raise_for_status()
+    async def analyze_many(self, urls: List[str], max_concurrent: int = 32,
+                           parse_executor: Optional[Executor] = None) -> List[PageAnalysis]:
+        """
+        Analyze several HTML pages concurrently over the pooled client.
+        
+        Args:
+            urls: URLs of the web pages to analyze
+            max_concurrent: Maximum number of pages in flight
+            parse_executor: Optional (process pool) executor to parse the pages in
             
-            # Check content length
-            if len(response.content) > self.config.max_content_length:
-                return None
+        Returns:
+            PageAnalysis objects in the same order as the URLs
+        """
+        return await analyze_concurrently(
+            urls, functools.partial(self.analyze, parse_executor=parse_executor), max_concurrent
+        )
+    
+    async def analyze_metadata_only(self, url: str, timeout: Optional[float] = None,
+                                    content_type: ContentType = ContentType.HTML) -> Optional[PageMetadata]:
+        """
+        Fetch a page and extract only its metadata.
+        
+        Skips main-content extraction, scoring and link/image/feed discovery.
+        
+        Args:
+            url: URL of the web page to analyze
+            timeout: Optional per-request timeout overriding the client's
+            content_type: Content type to report for the page
+            
+        Returns:
+            PageMetadata object, or None if the page could not be fetched
+        """
+        response = await self._fetch_page(url, timeout=timeout)
+        if not response:
+            return None
+        
+        # Sources in <head> come first in every priority list, so when the head
+        # alone yields every field the rest of a (possibly huge) page is skipped
+        nodes = _head_nodes(response.text)
+        fields = self._metadata_fields(nodes) if nodes is not None else None
+        if fields is None or None in fields:
+            nodes = _collect_nodes(_parse_html(response.text))
+            fields = self._metadata_fields(nodes)
+        title, description, author, published_date = fields
+        
+        return PageMetadata(
+            url=url,
+            title=title,
+            description=description,
+            language=self._detect_language(title or description or ""),
+            author=author,
+            published_date=published_date,
+            last_modified=self._extract_last_modified(nodes, response.headers),
+            content_type=content_type,
+            status_code=response.status_code,
+            response_time=response.elapsed.total_seconds(),
+            content_length=len(response.content)
+        )
+    
+    def _metadata_fields(self, nodes: _PageNodes) -> Tuple[Optional[str], Optional[str],
+                                                           Optional[str], Optional[datetime]]:
+        """Title, description, author and published date extracted from nodes."""
+        return (
+            self._extract_title(nodes),
+            self._extract_description(nodes),
+            self._extract_author(nodes),
+            self._extract_published_date(nodes)
+        )
+    
+    def _build_analysis(self, response: FetchedPage, url: str, start_time: float) -> PageAnalysis:
+        """Parse a fetched page and assemble its PageAnalysis (CPU-bound, no I/O)."""
+        # Parse HTML content and gather everything the extractors need in one pass
+        nodes = _collect_nodes(_parse_html(response.text))
+        
+        # Extract basic metadata
+        title = self._extract_title(nodes)
+        description = self._extract_description(nodes)
+        
+        # Extract main content using readability
+        main_content = self._extract_main_content(response.text, url)
+        
+        # Generate summary from main content
+        summary = self._generate_summary(main_content)
+        
+        # Extract additional metadata
+        author = self._extract_author(nodes)
+        published_date = self._extract_published_date(nodes)
+        last_modified = self._extract_last_modified(nodes, response.headers)
+        
+        # Detect language
+        language = self._detect_language(main_content or title or "")
+        
+        # Calculate quality scores
+        relevance_score = self._calculate_relevance_score(main_content, title, description)
+        quality_score = self._calculate_quality_score(main_content, nodes, len(response.text))
+        freshness_score = self._calculate_freshness_score(published_date, last_modified)
+        
+        # Extract resources if configured
+        feeds_discovered = []
+        images = []
+        external_links = []
+        
+        base = _parse_url(url)
+        
+        if self.config.discover_feeds:
+            feeds_discovered = self._discover_feeds(nodes, url, base)
+        
+        if self.config.extract_images:
+            images = self._extract_images(nodes, url)
+            
+        if self.config.extract_links:
+            external_links = self._extract_external_links(nodes, url, base)
+        
+        processing_time = time.time() - start_time
+        
+        # every field comes from our own extractors, so skip re-validation
+        return PageAnalysis.model_construct(
+            url=url,
+            content_type=ContentType.HTML,
+            status=AnalysisStatus.SUCCESS,
+            title=title,
+            description=description,
+            main_content=main_content,
+            summary=summary,
+            language=language,
+            author=author,
+            published_date=published_date,
+            last_modified=last_modified,
+            relevance_score=relevance_score,
+            quality_score=quality_score,
+            freshness_score=freshness_score,
+            feeds_discovered=feeds_discovered,
+            images=images,
+            external_links=external_links,
+            response_time=response.elapsed.total_seconds(),
+            content_length=len(response.content),
+            status_code=response.status_code,
+            analyzed_at=start_time,
+            processing_time=processing_time
+        )
+    
+    async def _fetch_page(self, url: str, timeout: Optional[float] = None) -> Optional[FetchedPage]:
+        """
+        Fetch web page with error handling, optionally overriding the client timeout.
+        
+        The body is streamed and the download abandoned as soon as it exceeds
+        max_content_length, so oversized pages are never fully read or decoded.
+        """
+        try:
+            kwargs = {"timeout": timeout} if timeout is not None else {}
+            async with self.client.stream("GET", url, **kwargs) as response:
+                response.raise_for_status()
+                
+                # Check content length
+                max_length = self.config.max_content_length
+                declared = response.headers.get("content-length")
+                if declared and declared.isdigit() and int(declared) > max_length:
+                    return None
                 
-            return response
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body.extend(chunk)
+                    if len(body) > max_length:
+                        return None
+            
+            return FetchedPage(response, bytes(body))
         except:
             return None
     
-    def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_title(self, nodes: _PageNodes) -> Optional[str]:
         """Extract page title from HTML."""
         # Try various title sources
-        title_selectors = [
-            'title',
-            'meta[property="og:title"]',
-            'meta[name="twitter:title"]',
-            'h1'
-        ]
-        
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element:
-                title = element.get('content') if element.has_attr('content') else element.get_text()
+        for source in _TITLE_SOURCES:
+            element = nodes.first.get(source)
+            if element is not None:
+                title = element.get('content')
+                if title is None:
+                    title = element.text_content()
                 if title and title.strip():
                     return title.strip()[:200]  # Limit title length
         
         return None
     
-    def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_description(self, nodes: _PageNodes) -> Optional[str]:
         """Extract page description from HTML."""
         # Try various description sources
-        desc_selectors = [
-            'meta[name="description"]',
-            'meta[property="og:description"]',
-            'meta[name="twitter:description"]'
-        ]
-        
-        for selector in desc_selectors:
-            element = soup.select_one(selector)
-            if element and element.get('content'):
+        for source in _DESCRIPTION_SOURCES:
+            element = nodes.first.get(source)
+            if element is not None and element.get('content'):
                 desc = element.get('content').strip()
                 if desc:
                     return desc[:500]  # Limit description length
@@ -186,17 +483,17 @@ class HtmlAnalyzer:
             
             if content:
                 # Parse the extracted content to get clean text
-                soup = BeautifulSoup(content, 'html.parser')
+                tree = _parse_html(content)
                 
-                # Remove unwanted elements
-                for element in soup(['script', 'style', 'nav', 'footer', 'aside']):
-                    element.decompose()
+                # Remove unwanted elements (their tail text stays)
+                for element in _BOILERPLATE(tree):
+                    element.drop_tree()
                 
                 # Extract text content
-                text = soup.get_text(separator=' ', strip=True)
+                text = ' '.join(part.strip() for part in _TEXT_NODES(tree) if part.strip())
                 
                 # Clean up whitespace
-                text = re.sub(r'\s+', ' ', text).strip()
+                text = _WHITESPACE_RE.sub(' ', text).strip()
                 
                 # Check minimum length
                 if len(text) >= self.config.min_content_length:
@@ -212,87 +509,66 @@ class HtmlAnalyzer:
         if not content:
             return None
         
-        # Simple summary: first few sentences up to 300 characters
-        sentences = re.split(r'[.!?]+', content)
-        summary = ""
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if sentence and len(summary + sentence) <= 300:
-                summary += sentence + ". "
-            else:
+        # Simple summary: first few sentences up to 300 characters, scanning
+        # only as far into the content as the summary reaches
+        sentences = []
+        length = 0
+        position = 0
+        
+        while True:
+            match = _SENTENCE_SPLIT_RE.search(content, position)
+            end = match.start() if match else len(content)
+            sentence = content[position:end].strip()
+            if not sentence or length + len(sentence) > 300:
+                break
+            sentences.append(sentence)
+            length += len(sentence) + 2  # the ". " separator
+            if match is None:
                 break
+            position = match.end()
         
-        return summary.strip() if summary else None
+        return '. '.join(sentences) + '.' if sentences else None
     
-    def _extract_author(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_author(self, nodes: _PageNodes) -> Optional[str]:
         """Extract author information from HTML."""
-        author_selectors = [
-            'meta[name="author"]',
-            'meta[property="article:author"]',
-            'meta[name="twitter:creator"]',
-            '[rel="author"]',
-            '.author',
-            '.byline'
-        ]
-        
-        for selector in author_selectors:
-            element = soup.select_one(selector)
-            if element:
-                author = element.get('content') if element.has_attr('content') else element.get_text()
+        for source in _AUTHOR_SOURCES:
+            element = nodes.first.get(source)
+            if element is not None:
+                author = element.get('content')
+                if author is None:
+                    author = element.text_content()
                 if author and author.strip():
                     return author.strip()[:100]
         
         return None
     
-    def _extract_published_date(self, soup: BeautifulSoup) -> Optional[datetime]:
+    def _extract_published_date(self, nodes: _PageNodes) -> Optional[datetime]:
         """Extract published date from HTML."""
-        date_selectors = [
-            'meta[property="article:published_time"]',
-            'meta[name="date"]',
-            'meta[name="publishdate"]',
-            'time[datetime]',
-            '[datetime]'
-        ]
-        
-        for selector in date_selectors:
-            element = soup.select_one(selector)
-            if element:
-                date_str = element.get('content') or element.get('datetime') or element.get_text()
+        for source in _PUBLISHED_SOURCES:
+            element = nodes.first.get(source)
+            if element is not None:
+                date_str = element.get('content') or element.get('datetime') or element.text_content()
                 if date_str:
-                    try:
-                        from dateutil import parser
-                        return parser.parse(date_str)
-                    except:
-                        continue
+                    published = _parse_date(date_str)
+                    if published is not None:
+                        return published
         
         return None
     
-    def _extract_last_modified(self, soup: BeautifulSoup, headers: dict) -> Optional[datetime]:
+    def _extract_last_modified(self, nodes: _PageNodes, headers: dict) -> Optional[datetime]:
         """Extract last modified date from HTML or headers."""
         # Try HTML meta tags first
-        modified_selectors = [
-            'meta[property="article:modified_time"]',
-            'meta[name="last-modified"]'
-        ]
-        
-        for selector in modified_selectors:
-            element = soup.select_one(selector)
-            if element and element.get('content'):
-                try:
-                    from dateutil import parser
-                    return parser.parse(element.get('content'))
-                except:
-                    continue
+        for source in _MODIFIED_SOURCES:
+            element = nodes.first.get(source)
+            if element is not None and element.get('content'):
+                modified = _parse_date(element.get('content'))
+                if modified is not None:
+                    return modified
         
         # Try HTTP headers
         last_modified = headers.get('last-modified')
         if last_modified:
-            try:
-                from dateutil import parser
-                return parser.parse(last_modified)
-            except:
-                pass
+            return _parse_date(last_modified)
         
         return None
     
@@ -301,12 +577,8 @@ class HtmlAnalyzer:
         if not self.config.detect_language or not text:
             return None
         
-        try:
-            # Use only first 1000 characters for language detection
-            sample = text[:1000]
-            return detect(sample)
-        except LangDetectError:
-            return None
+        # Use only first 1000 characters for language detection
+        return detect_language(text[:1000])
     
     def _calculate_relevance_score(self, content: Optional[str], title: Optional[str], 
                                  description: Optional[str]) -> float:
@@ -331,43 +603,47 @@ class HtmlAnalyzer:
             elif content_length >= 200:
                 score += 0.2
             
-            # Check for structured content (presence of meaningful sentences)
-            sentences = re.split(r'[.!?]+', content)
-            meaningful_sentences = [s for s in sentences if len(s.strip()) > 20]
-            if len(meaningful_sentences) >= 3:
-                score += 0.2
+            # Check for structured content (presence of meaningful sentences);
+            # stop scanning as soon as the third one is found
+            meaningful_sentences = 0
+            for sentence in _SENTENCE_SPLIT_RE.split(content):
+                if len(sentence.strip()) > 20:
+                    meaningful_sentences += 1
+                    if meaningful_sentences >= 3:
+                        score += 0.2
+                        break
         
         return min(score, 1.0)
     
-    def _calculate_quality_score(self, content: Optional[str], soup: BeautifulSoup) -> float:
-        """Calculate content quality score."""
+    def _calculate_quality_score(self, content: Optional[str], nodes: _PageNodes,
+                                 html_length: int) -> float:
+        """Calculate content quality score (html_length is the length of the page source)."""
         if not self.config.calculate_scores:
             return 0.0
         
         score = 0.0
         
         # Check for semantic HTML structure
-        if soup.find('main') or soup.find('article'):
+        if nodes.has_sectioning:
             score += 0.2
         
-        if soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+        # Only presence matters here
+        if nodes.has_heading:
             score += 0.2
         
         # Check content quality
         if content:
             # Ratio of text to HTML
             text_length = len(content)
-            html_length = len(str(soup))
             if html_length > 0 and text_length / html_length > 0.1:
                 score += 0.3
             
             # Check for lists, which often indicate structured content
-            if soup.find_all(['ul', 'ol']):
+            if nodes.has_list:
                 score += 0.1
             
             # Check for images with alt text
-            images_with_alt = soup.find_all('img', alt=True)
-            if images_with_alt:
+            if nodes.has_image_alt:
                 score += 0.2
         
         return min(score, 1.0)
@@ -404,79 +680,81 @@ class HtmlAnalyzer:
         else:
             return 0.1
     
-    def _discover_feeds(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    def _discover_feeds(self, nodes: _PageNodes, base_url: str, base: ParseResult) -> List[str]:
         """Discover RSS/Atom feeds on the page."""
         feeds = []
+        seen = set()
         
         # Look for feed links in HTML head
-        feed_links = soup.find_all('link', rel=lambda x: x and 'alternate' in x.lower())
-        
-        for link in feed_links:
-            href = link.get('href')
-            type_attr = link.get('type', '').lower()
-            
-            if href and any(feed_type in type_attr for feed_type in 
-                          ['rss', 'atom', 'xml', 'feed']):
+        for href in nodes.feed_hrefs:
+            if href:
                 full_url = urljoin(base_url, href)
-                if full_url not in feeds:
+                if full_url not in seen:
+                    seen.add(full_url)
                     feeds.append(full_url)
+                    if len(feeds) == 10:
+                        return feeds
         
         # Look for common feed URLs
-        common_feeds = ['/feed', '/rss', '/rss.xml', '/atom.xml', '/feeds/all.atom.xml']
-        base_domain = f"{urlparse(base_url).scheme}://{urlparse(base_url).netloc}"
-        
-        for feed_path in common_feeds:
-            feed_url = base_domain + feed_path
-            if feed_url not in feeds:
+        for feed_url in _guessed_feed_urls(f"{base.scheme}://{base.netloc}"):
+            if feed_url not in seen:
+                seen.add(feed_url)
                 feeds.append(feed_url)
         
         return feeds[:10]  # Limit to 10 feeds
     
-    def _extract_images(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    def _extract_images(self, nodes: _PageNodes, base_url: str) -> List[str]:
         """Extract image URLs from the page."""
         images = []
+        seen = set()
         
-        for img in soup.find_all('img', src=True):
-            src = img.get('src')
+        for src in nodes.image_sources:
             if src:
                 full_url = urljoin(base_url, src)
-                if full_url not in images:
+                if full_url not in seen:
+                    seen.add(full_url)
                     images.append(full_url)
+                    if len(images) == 20:  # Limit to 20 images
+                        break
         
-        return images[:20]  # Limit to 20 images
+        return images
     
-    def _extract_external_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    def _extract_external_links(self, nodes: _PageNodes, base_url: str, base: ParseResult) -> List[str]:
         """Extract external links from the page."""
-        base_domain = urlparse(base_url).netloc
+        base_domain = base.netloc
         external_links = []
+        seen = set()
         
-        for link in soup.find_all('a', href=True):
-            href = link.get('href')
+        for href in nodes.link_targets:
             if href:
                 full_url = urljoin(base_url, href)
-                parsed = urlparse(full_url)
+                parsed = _parse_url(full_url)
                 
                 # Check if it's an external link
                 if parsed.netloc and parsed.netloc != base_domain:
-                    if full_url not in external_links:
+                    if full_url not in seen:
+                        seen.add(full_url)
                         external_links.append(full_url)
+                        if len(external_links) == 50:  # Limit to 50 external links
+                            break
         
-        return external_links[:50]  # Limit to 50 external links
+        return external_links
     
     def _error_result(self, url: str, error_msg: str, start_time: float, 
                      status: AnalysisStatus = AnalysisStatus.ERROR) -> PageAnalysis:
         """Create error result for failed analysis."""
         processing_time = time.time() - start_time
         
-        return PageAnalysis(
+        return PageAnalysis.model_construct(
             url=url,
             content_type=ContentType.HTML,
             status=status,
             error_message=error_msg,
-            analyzed_at=datetime.now(),
+            analyzed_at=start_time,
             processing_time=processing_time
         )
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
\ No newline at end of file
+        """Release the shared HTTP client."""
+        if self._http:
+            await release_client(self.config)
\ No newline at end of file
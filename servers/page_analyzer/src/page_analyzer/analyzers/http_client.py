@@ -0,0 +1,127 @@
+"""Pooled HTTP clients and fetched responses shared by the analyzers."""
+
+import asyncio
+import importlib.util
+import weakref
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import httpx
+
+from ..analysis_types import AnalysisConfig
+
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connections belong to the event loop that opened them, so clients are pooled
+# per loop: loop -> client settings -> shared client
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Client settings -> number of analyzers using them
+_client_users: Dict[Tuple, int] = {}
+
+
+def _client_key(config: AnalysisConfig) -> Tuple:
+    """The settings a pooled client is shared by."""
+    return (config.timeout, config.follow_redirects, config.user_agent)
+
+
+def acquire_client(config: AnalysisConfig) -> None:
+    """Register an analyzer as a user of the pooled clients for these settings."""
+    key = _client_key(config)
+    _client_users[key] = _client_users.get(key, 0) + 1
+
+
+async def release_client(config: AnalysisConfig) -> None:
+    """Drop one user of these settings, closing their pooled clients with the last one."""
+    key = _client_key(config)
+    users = _client_users.get(key, 0) - 1
+    if users > 0:
+        _client_users[key] = users
+        return
+    _client_users.pop(key, None)
+    
+    loop = asyncio.get_running_loop()
+    for client_loop, clients in list(_shared_clients.items()):
+        client = clients.pop(key, None)
+        # Clients of other (usually finished) loops can't be closed from here
+        if client is not None and client_loop is loop:
+            await client.aclose()
+
+
+def pooled_client(config: AnalysisConfig) -> httpx.AsyncClient:
+    """Return the running loop's pooled client for these settings, creating it on first use."""
+    clients = _shared_clients.setdefault(asyncio.get_running_loop(), {})
+    key = _client_key(config)
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = clients[key] = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(config.timeout),
+            follow_redirects=config.follow_redirects,
+            limits=httpx.Limits(
+                max_connections=128,
+                max_keepalive_connections=64,
+                keepalive_expiry=30.0
+            ),
+            headers={"User-Agent": config.user_agent}
+        )
+    return client
+
+
+_Result = TypeVar('_Result')
+
+
+async def analyze_concurrently(urls: List[str], analyze: Callable[[str], Awaitable[_Result]],
+                               max_concurrent: int) -> List[_Result]:
+    """
+    Run analyze over the URLs with at most max_concurrent in flight.
+    
+    analyze must turn failures into error results, so gather never raises.
+    Results come back in the same order as the URLs.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def analyze_one(url: str) -> _Result:
+        async with semaphore:
+            return await analyze(url)
+    
+    return await asyncio.gather(*(analyze_one(url) for url in urls))
+
+
+class PooledClient:
+    """
+    Analyzer attribute resolving to the pooled client for the running event loop.
+    
+    Assigning a client (e.g. one with a mock transport) uses it instead of the pool.
+    """
+    
+    def __get__(self, analyzer, owner=None):
+        if analyzer is None:
+            return self
+        client = analyzer.__dict__.get('_client')
+        return client if client is not None else pooled_client(analyzer.config)
+    
+    def __set__(self, analyzer, client: Optional[httpx.AsyncClient]):
+        analyzer.__dict__['_client'] = client
+
+
+class FetchedPage:
+    """A fetched page body with the response details the analyzers use."""
+    
+    def __init__(self, response: httpx.Response, content: bytes):
+        self.content = content
+        self.headers = response.headers
+        self.status_code = response.status_code
+        self.elapsed = response.elapsed
+        self.encoding = response.charset_encoding or "utf-8"
+        self._text: Optional[str] = None
+    
+    @property
+    def text(self) -> str:
+        """Decoded body, decoded only on first access."""
+        if self._text is None:
+            self._text = self.content.decode(self.encoding, errors="replace")
+        return self._text
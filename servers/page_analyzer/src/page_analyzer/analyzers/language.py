@@ -0,0 +1,83 @@
+"""Language detection shared by the page and feed analyzers."""
+
+import functools
+import os
+import threading
+from typing import Optional
+
+from langdetect import detect, detector_factory
+from langdetect.lang_detect_exception import LangDetectException as LangDetectError
+
+try:
+    import gcld3
+except ImportError:  # optional: compiled language detection when installed
+    gcld3 = None
+
+
+# Language profiles loaded into langdetect. Loading all 55 costs tens of MB per
+# process; text in any other language is reported as the closest of these.
+_LANGDETECT_LANGUAGES = (
+    'en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'ko',
+    'zh-cn', 'zh-tw', 'ar', 'hi', 'id', 'nl'
+)
+
+
+_language_factory_lock = threading.Lock()
+
+
+def _init_language_factory():
+    """Load only the _LANGDETECT_LANGUAGES profiles into langdetect's shared factory."""
+    if detector_factory._factory is not None:
+        return
+    # Detection runs on worker threads, so the first calls can race to load
+    with _language_factory_lock:
+        if detector_factory._factory is not None:
+            return
+        profiles = []
+        for language in _LANGDETECT_LANGUAGES:
+            path = os.path.join(detector_factory.PROFILES_DIRECTORY, language)
+            with open(path, encoding='utf-8') as profile:
+                profiles.append(profile.read())
+        factory = detector_factory.DetectorFactory()
+        factory.load_json_profile(profiles)
+        detector_factory._factory = factory
+
+
+# langdetect builds its factory lazily through this hook on the first detect()
+detector_factory.init_factory = _init_language_factory
+
+
+# gcld3 codes that langdetect spells differently
+_GCLD3_CODES = {'iw': 'he'}
+
+# Detection runs on worker threads; each gets its own gcld3 identifier
+_gcld3_identifiers = threading.local()
+
+
+def _gcld3_language(sample: str) -> Optional[str]:
+    """Language of a sample according to gcld3, or None if it is not confident."""
+    identifier = getattr(_gcld3_identifiers, 'identifier', None)
+    if identifier is None:
+        identifier = _gcld3_identifiers.identifier = gcld3.NNetLanguageIdentifier(
+            min_num_bytes=0, max_num_bytes=1000
+        )
+    result = identifier.FindLanguage(text=sample)
+    language = result.language
+    # Chinese and romanized scripts are left to langdetect, which reports them
+    # as zh-cn/zh-tw or not at all
+    if not result.is_reliable or language == 'und' or language == 'zh' or '-' in language:
+        return None
+    return _GCLD3_CODES.get(language, language)
+
+
+@functools.lru_cache(maxsize=4096)
+def detect_language(sample: str) -> Optional[str]:
+    """Detect the language of a text sample (cached per sample), or None."""
+    if gcld3 is not None:
+        language = _gcld3_language(sample)
+        if language is not None:
+            return language
+    try:
+        return detect(sample)
+    except LangDetectError:
+        return None
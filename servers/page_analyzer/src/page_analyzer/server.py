@@ -5,7 +5,11 @@ Provides comprehensive web page content analysis and extraction.
 
 import asyncio
 import json
-from typing import Optional, List, Dict, Any, Union
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple, Union
 
 from mcp.server.fastmcp import FastMCP
 
@@ -15,7 +19,6 @@ try:
 except ImportError:
     # For running as script
     import sys
-    import os
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
     from analysis_manager import AnalysisManager
     from analysis_types import AnalysisConfig, ContentType
@@ -23,8 +26,24 @@ except ImportError:
 # Initialize FastMCP server
 mcp = FastMCP("page_analyzer")
 
-# Initialize analysis manager
-analysis_manager = AnalysisManager()
+# Initialize analysis manager (created at import, before mcp.run() starts the loop);
+# uvloop is opt-in through PAGE_ANALYZER_UVLOOP=1
+analysis_manager = AnalysisManager(AnalysisConfig(
+    use_uvloop=os.environ.get("PAGE_ANALYZER_UVLOOP", "").lower() in ("1", "true", "yes")
+))
+
+# Background analysis jobs: job_id -> (started_at, task)
+_analysis_jobs: Dict[str, Tuple[float, asyncio.Task]] = {}
+# Unpolled jobs are dropped this long after they were started
+_JOB_RETENTION_SECONDS = 600
+
+
+def _prune_analysis_jobs(now: float) -> None:
+    """Cancel and drop jobs nobody polled within the retention window."""
+    for job_id, (started_at, task) in list(_analysis_jobs.items()):
+        if now - started_at > _JOB_RETENTION_SECONDS:
+            task.cancel()
+            del _analysis_jobs[job_id]
 
 
 @mcp.tool()
@@ -42,10 +61,10 @@ async def analyze_page(
     Args:
         url: URL of the web page to analyze
         content_type: Expected content type hint ("html", "rss", "api", "auto")
-        extract_links: Whether to extract external links from the page
-        extract_images: Whether to extract image URLs from the page
-        discover_feeds: Whether to discover RSS/Atom feeds on the page
-        timeout: Request timeout in seconds (5-120)
+        extract_links: Accepted but ignored; the server's AnalysisConfig decides this
+        extract_images: Accepted but ignored; the server's AnalysisConfig decides this
+        discover_feeds: Accepted but ignored; the server's AnalysisConfig decides this
+        timeout: Accepted but ignored; the server's AnalysisConfig timeout applies
         
     Returns:
         Dictionary containing extracted content, metadata, and analysis results
@@ -53,21 +72,11 @@ async def analyze_page(
     try:
         # Validate inputs
         content_type = content_type.lower() if content_type != "auto" else None
-        timeout = max(5, min(timeout, 120))
-        
-        # Create analysis options
-        options = {
-            "extract_links": extract_links,
-            "extract_images": extract_images,
-            "discover_feeds": discover_feeds,
-            "timeout": timeout
-        }
         
         # Perform analysis
         analysis = await analysis_manager.analyze_page(
             url=url,
-            content_type=content_type,
-            options=options
+            content_type=content_type
         )
         
         # Convert to dictionary for JSON serialization
@@ -92,7 +101,7 @@ async def analyze_page(
             "response_time": analysis.response_time,
             "content_length": analysis.content_length,
             "status_code": analysis.status_code,
-            "analyzed_at": analysis.analyzed_at.isoformat(),
+            "analyzed_at": datetime.fromtimestamp(analysis.analyzed_at).isoformat(),
             "processing_time": analysis.processing_time,
             "error_message": analysis.error_message
         }
@@ -105,6 +114,103 @@ async def analyze_page(
         }
 
 
+@mcp.tool()
+async def start_analysis(
+    url: str,
+    content_type: str = "auto",
+    extract_links: bool = False,
+    extract_images: bool = False,
+    discover_feeds: bool = True,
+    timeout: int = 30
+) -> dict:
+    """
+    Start analyzing a web page in the background and return a job ID immediately.
+    
+    Use this instead of analyze_page for slow pages, then call poll_analysis with
+    the returned job ID until the status is no longer "pending".
+    
+    Args:
+        url: URL of the web page to analyze
+        content_type: Expected content type hint ("html", "rss", "api", "auto")
+        extract_links: Whether to extract external links from the page
+        extract_images: Whether to extract image URLs from the page
+        discover_feeds: Whether to discover RSS/Atom feeds on the page
+        timeout: Request timeout in seconds (5-120)
+        
+    Returns:
+        Dictionary containing the job ID and its initial status
+    """
+    try:
+        now = time.time()
+        _prune_analysis_jobs(now)
+        
+        job_id = uuid.uuid4().hex
+        task = asyncio.create_task(analyze_page(
+            url=url,
+            content_type=content_type,
+            extract_links=extract_links,
+            extract_images=extract_images,
+            discover_feeds=discover_feeds,
+            timeout=timeout
+        ))
+        _analysis_jobs[job_id] = (now, task)
+        
+        return {
+            "job_id": job_id,
+            "url": url,
+            "status": "pending"
+        }
+        
+    except Exception as e:
+        return {
+            "error": f"Failed to start analysis: {str(e)}",
+            "url": url,
+            "status": "error"
+        }
+
+
+@mcp.tool()
+async def poll_analysis(job_id: str) -> dict:
+    """
+    Check a background analysis started with start_analysis.
+    
+    Args:
+        job_id: Job ID returned by start_analysis
+        
+    Returns:
+        Dictionary with status "pending" while running, or status "completed"
+        and the analyze_page result once finished
+    """
+    try:
+        _prune_analysis_jobs(time.time())
+        job = _analysis_jobs.get(job_id)
+        if job is None:
+            return {
+                "error": f"Unknown or expired job ID: {job_id}",
+                "job_id": job_id,
+                "status": "error"
+            }
+        
+        _, task = job
+        if not task.done():
+            return {"job_id": job_id, "status": "pending"}
+        
+        # Results are handed out once
+        del _analysis_jobs[job_id]
+        return {
+            "job_id": job_id,
+            "status": "completed",
+            "result": task.result()
+        }
+        
+    except Exception as e:
+        return {
+            "error": f"Failed to poll analysis: {str(e)}",
+            "job_id": job_id,
+            "status": "error"
+        }
+
+
 @mcp.tool()
 async def analyze_batch(
     urls: List[str],
@@ -120,10 +226,10 @@ async def analyze_batch(
     Args:
         urls: List of URLs to analyze (1-50 URLs)
         max_concurrent: Maximum concurrent analyses (1-10)
-        timeout_per_url: Timeout per URL in seconds (5-120)
-        extract_feeds: Whether to discover feeds on pages
-        extract_links: Whether to extract external links
-        full_content: Whether to extract full content or just metadata
+        timeout_per_url: Accepted but ignored; the server's AnalysisConfig timeout applies
+        extract_feeds: Accepted but ignored; the server's AnalysisConfig decides this
+        extract_links: Accepted but ignored; the server's AnalysisConfig decides this
+        full_content: Whether to include the full content in the results
         
     Returns:
         Dictionary containing batch analysis results and statistics
@@ -137,21 +243,11 @@ async def analyze_batch(
             return {"error": "Too many URLs. Maximum is 50."}
         
         max_concurrent = max(1, min(max_concurrent, 10))
-        timeout_per_url = max(5, min(timeout_per_url, 120))
-        
-        # Create analysis options
-        options = {
-            "extract_links": extract_links,
-            "discover_feeds": extract_feeds,
-            "extract_main_content": full_content,
-            "timeout": timeout_per_url
-        }
         
         # Perform batch analysis
         batch_response = await analysis_manager.analyze_batch(
             urls=urls,
-            max_concurrent=max_concurrent,
-            options=options
+            max_concurrent=max_concurrent
         )
         
         # Convert results to dictionaries
@@ -182,7 +278,7 @@ async def analyze_batch(
             "failed_analyses": batch_response.failed_analyses,
             "total_processing_time": batch_response.total_processing_time,
             "results": results,
-            "errors": batch_response.errors
+            "errors": [f"{url}: {message}" for url, message in batch_response.errors]
         }
         
     except Exception as e:
@@ -309,7 +405,7 @@ async def get_page_metadata(
     
     Args:
         url: URL to analyze
-        quick_mode: Skip heavy content extraction for faster results
+        quick_mode: Use a shorter timeout and HTML-only parsing for faster results
         
     Returns:
         Dictionary containing basic page metadata and information
@@ -378,6 +474,7 @@ async def get_analyzer_status() -> dict:
                 "rss_atom_feed_parsing": True,
                 "api_response_analysis": True,
                 "batch_processing": True,
+                "background_jobs": True,
                 "concurrent_analysis": True,
                 "metadata_extraction": True,
                 "feed_discovery": True,
@@ -1,10 +1,12 @@
 """Tests for the AnalysisManager class."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
 from page_analyzer.analysis_manager import AnalysisManager
-from page_analyzer.analysis_types import ContentType, AnalysisStatus
+from page_analyzer.analysis_types import ContentType, AnalysisStatus, PageMetadata
 
 
 class TestAnalysisManager:
@@ -155,29 +157,55 @@ class TestAnalysisManager:
             assert result.total_records == 1
             mock_analyze.assert_called_once_with('https://api.test.com', test_data, None)
     
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('analyzer_name, method_name', [
+        ('api_analyzer', 'analyze_api_response'),
+        ('html_analyzer', 'analyze'),
+    ])
+    async def test_batch_analysis_limit(self, analysis_manager, analyzer_name, method_name):
+        """Test analyze_many keeps URL order and the concurrency limit."""
+        in_flight = 0
+        peak = 0
+        
+        async def fake_analyze(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return url
+        
+        analyzer = getattr(analysis_manager, analyzer_name)
+        urls = [f'https://test.com/{i}' for i in range(6)]
+        with patch.object(analyzer, method_name, side_effect=fake_analyze):
+            results = await analyzer.analyze_many(urls, max_concurrent=2)
+        
+        assert results == urls
+        assert peak == 2
+    
     @pytest.mark.asyncio
     async def test_metadata_extraction(self, analysis_manager):
-        """Test quick metadata extraction."""
-        with patch.object(analysis_manager, 'analyze_page') as mock_analyze:
-            # Setup mock response for full analysis path
-            mock_analyze.return_value = type('MockAnalysis', (), {
-                'url': 'https://test.com',
-                'title': 'Test Page',
-                'description': 'Test Description', 
-                'language': 'en',
-                'author': 'Test Author',
-                'published_date': None,
-                'last_modified': None,
-                'content_type': ContentType.HTML,
-                'status_code': 200,
-                'response_time': 1.0,
-                'content_length': 1000,
-                'error_message': None
-            })()
+        """Test metadata extraction skips full page analysis for HTML pages."""
+        with patch.object(analysis_manager.html_analyzer, 'analyze_metadata_only') as mock_metadata, \
+                patch.object(analysis_manager, 'analyze_page') as mock_analyze:
+            # Setup mock response for the metadata-only path
+            mock_metadata.return_value = PageMetadata(
+                url='https://test.com',
+                title='Test Page',
+                description='Test Description',
+                language='en',
+                author='Test Author',
+                content_type=ContentType.HTML,
+                status_code=200,
+                response_time=1.0,
+                content_length=1000
+            )
             
             # Test metadata extraction (non-quick mode)
             result = await analysis_manager.get_page_metadata('https://test.com', quick_mode=False)
             
             assert result.url == 'https://test.com'
             assert result.title == 'Test Page'
-            assert result.content_type == ContentType.HTML
\ No newline at end of file
+            assert result.content_type == ContentType.HTML
+            mock_metadata.assert_called_once_with('https://test.com', timeout=None, content_type=ContentType.HTML)
+            mock_analyze.assert_not_called()
\ No newline at end of file
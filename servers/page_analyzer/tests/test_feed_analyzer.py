@@ -0,0 +1,156 @@
+"""Tests for the FeedAnalyzer class."""
+
+import asyncio
+import time
+
+import feedparser
+import httpx
+import pytest
+from unittest.mock import patch
+
+from page_analyzer.analyzers.feed_analyzer import FeedAnalyzer
+from page_analyzer.analysis_types import AnalysisConfig, AnalysisStatus
+
+
+RSS = (b'<?xml version="1.0"?><rss version="2.0"><channel><title>%s</title>'
+       b'<item><title>Entry</title><link>https://test.com/entry</link></item></channel></rss>')
+
+
+class StreamedBody(httpx.AsyncByteStream):
+    """Response body served in chunks, like a real streamed download."""
+    
+    def __init__(self, body: bytes, chunk_size: int = 1024):
+        self.body = body
+        self.chunk_size = chunk_size
+        self.chunks_read = 0
+    
+    async def __aiter__(self):
+        for start in range(0, len(self.body), self.chunk_size):
+            self.chunks_read += 1
+            yield self.body[start:start + self.chunk_size]
+
+
+def respond(status_code: int = 200, body: bytes = b'', **headers) -> httpx.Response:
+    """A streamed response; headers are given with underscores for dashes."""
+    return httpx.Response(
+        status_code,
+        headers={name.replace('_', '-'): value for name, value in headers.items()},
+        stream=StreamedBody(body)
+    )
+
+
+def make_analyzer(handler, **config) -> FeedAnalyzer:
+    """FeedAnalyzer whose requests are answered by handler."""
+    analyzer = FeedAnalyzer(AnalysisConfig(**config))
+    analyzer.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return analyzer
+
+
+class TestFeedAnalyzer:
+    """Test cases for FeedAnalyzer."""
+    
+    @pytest.mark.asyncio
+    async def test_revalidation_reuses_analysis(self):
+        """Test an unchanged feed is revalidated with a 304 and not parsed again."""
+        conditional = []
+        
+        async def handler(request):
+            conditional.append(request.headers.get('if-none-match'))
+            if request.headers.get('if-none-match') == '"v1"':
+                return respond(304)
+            return respond(200, RSS % b'Feed', content_type='application/rss+xml', etag='"v1"')
+        
+        analyzer = make_analyzer(handler)
+        with patch('page_analyzer.analyzers.feed_analyzer.feedparser.parse', wraps=feedparser.parse) as parse:
+            first = await analyzer.analyze_feed('https://test.com/feed.xml')
+            second = await analyzer.analyze_feed('https://test.com/feed.xml')
+        await analyzer.close()
+        
+        assert conditional == [None, '"v1"']
+        assert parse.call_count == 1
+        assert first.status == second.status == AnalysisStatus.SUCCESS
+        assert second.title == first.title == 'Feed'
+        assert second.content_length == first.content_length
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('status_code, content_type, plausible', [
+        (200, 'application/rss+xml', True),
+        (200, '', True),
+        (200, 'text/html', False),
+        (404, 'text/html', False),
+        (405, 'text/html', True),  # HEAD not allowed: left to the GET
+        (501, 'text/html', True),  # HEAD not implemented: left to the GET
+    ])
+    async def test_probe_feed_url(self, status_code, content_type, plausible):
+        """Test the HEAD probe for guessed feed URLs."""
+        async def handler(request):
+            assert request.method == 'HEAD'
+            return respond(status_code, content_type=content_type) if content_type else respond(status_code)
+        
+        analyzer = make_analyzer(handler)
+        assert await analyzer._probe_feed_url('https://test.com/feed') is plausible
+        await analyzer.close()
+    
+    @pytest.mark.asyncio
+    async def test_non_feeds_are_not_parsed(self):
+        """Test candidate feeds without feed markup up front are skipped unparsed."""
+        page = b'<!DOCTYPE html><html><head><title>App</title></head><body>' + b'<p>x</p>' * 200 + b'</body></html>'
+        
+        async def handler(request):
+            if request.url.path == '/app':
+                return respond(200, page, content_type='application/rss+xml')
+            return respond(200, RSS % b'Mislabelled', content_type='text/plain')
+        
+        analyzer = make_analyzer(handler)
+        with patch('page_analyzer.analyzers.feed_analyzer.feedparser.parse', wraps=feedparser.parse) as parse:
+            skipped = await analyzer._analyze_direct_feed('https://test.com/app')
+            assert parse.call_count == 0
+            found = await analyzer._analyze_direct_feed('https://test.com/feed')
+        await analyzer.close()
+        
+        assert skipped is None
+        assert found.title == 'Mislabelled'
+    
+    @pytest.mark.asyncio
+    async def test_discovery_stops_after_enough_feeds(self):
+        """Test discovery stops validating once enough feeds are found, keeping page order."""
+        links = ''.join(f'<link rel="alternate" type="application/rss+xml" href="/f{i}.xml">' for i in range(5))
+        delays = {'/f0.xml': 5.0, '/f1.xml': 0.02, '/f2.xml': 5.0, '/f3.xml': 0.01, '/f4.xml': 0.03}
+        
+        async def handler(request):
+            path = request.url.path
+            if path == '/':
+                return respond(200, f'<html><head>{links}</head></html>'.encode(), content_type='text/html')
+            if path in delays:
+                await asyncio.sleep(delays[path])
+                return respond(200, RSS % path.encode(), content_type='application/rss+xml')
+            return respond(404)
+        
+        analyzer = make_analyzer(handler, feed_discovery_stop_after=2)
+        start = time.monotonic()
+        discovery = await analyzer.discover_feeds('https://test.com/')
+        elapsed = time.monotonic() - start
+        await analyzer.close()
+        
+        assert [feed.title for feed in discovery.feeds_found] == ['/f1.xml', '/f3.xml']
+        assert elapsed < 2.0
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('declared', [True, False])
+    async def test_feed_length_cap(self, declared):
+        """Test feeds over max_feed_length are rejected, before reading when the length is declared."""
+        body = StreamedBody(b'<rss>' + b' ' * 30_000)
+        
+        async def handler(request):
+            headers = {'content-type': 'application/rss+xml'}
+            if declared:
+                headers['content-length'] = str(len(body.body))
+            return httpx.Response(200, headers=headers, stream=body)
+        
+        analyzer = make_analyzer(handler, max_feed_length=10_000)
+        result = await analyzer.analyze_feed('https://test.com/feed.xml')
+        await analyzer.close()
+        
+        assert result.status == AnalysisStatus.ERROR
+        assert result.error_message == 'Feed too large (over 10000 bytes)'
+        assert body.chunks_read == (0 if declared else 10)